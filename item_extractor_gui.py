@@ -1,21 +1,1246 @@
 import sys
 import os
+import time
+
+# 시작 시간 측정 기준 (--benchmark-startup)
+_MODULE_START = time.perf_counter()
+
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QTabWidget, 
                            QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit, 
                            QFileDialog, QProgressBar, QLabel, QListWidget, QComboBox, 
-                           QLineEdit, QScrollArea, QGridLayout)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QPixmap, QImage
-import xml.etree.ElementTree as ET
-import shutil
+                           QLineEdit, QCheckBox)
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+import importlib
+import re
+import fnmatch
+import bisect
+import math
+import threading
+import queue
+from contextlib import contextmanager
+
+try:
+    import resource  # 유닉스 전용 (최대 RSS 측정)
+except ImportError:
+    resource = None
+
+
+def windows_peak_rss_kb():
+    """윈도우 최대 워킹셋 (KB) - GetProcessMemoryInfo의 PeakWorkingSetSize, 실패 시 None"""
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t)]
+
+    try:
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        # psapi.dll의 함수 (Windows 7 이상은 kernel32의 K32GetProcessMemoryInfo와 같음)
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return None
+    except (AttributeError, OSError):
+        return None
+    return counters.PeakWorkingSetSize // 1024
+
+
+class LazyModule:
+    """첫 속성 접근 시 import하는 모듈 대리 객체 (시작 시간 단축용)"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        value = getattr(self._module, attr)
+        setattr(self, attr, value)
+        return value
+
+
+# XML 파서는 파일을 처음 읽을 때 로드
+ET = LazyModule("xml.etree.ElementTree")
+
+
+def _env_flag(name):
+    """환경 변수 on/off 값 확인"""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class RunProfiler:
+    """추출 단계별/파일별 시간 및 메모리 계측"""
+
+    # 계측 옵션 환경 변수
+    ENV_DISABLE = "AION_EXTRACTOR_NO_STATS"       # 기본 계측 끄기
+    ENV_CPROFILE = "AION_EXTRACTOR_CPROFILE"      # cProfile 수집
+    ENV_TRACEMALLOC = "AION_EXTRACTOR_TRACEMALLOC"  # tracemalloc 수집
+
+    REPORT_FILE = "run_report.json"
+    PROFILE_FILE = "run_profile.prof"
+    PROFILE_TEXT_FILE = "run_profile.txt"
+
+    def __init__(self, enabled=True, cprofile=False, trace_memory=False):
+        self.enabled = enabled
+        self.cprofile = cprofile and enabled
+        self.trace_memory = trace_memory and enabled
+        
+        self.stages = {}    # 단계별 누적 통계
+        self.files = {}     # (단계, 파일)별 누적 통계
+        self._lock = threading.Lock()
+        
+        self._profile = None
+        self._thread_profiles = []  # 단계 스레드별 cProfile 결과
+        self._start_wall = None
+        self._start_cpu = None
+        self.total_wall = 0.0
+        self.total_cpu = 0.0
+        self.peak_traced = None
+
+    @classmethod
+    def from_env(cls):
+        """환경 변수 기반 생성"""
+        return cls(enabled=not _env_flag(cls.ENV_DISABLE),
+                   cprofile=_env_flag(cls.ENV_CPROFILE),
+                   trace_memory=_env_flag(cls.ENV_TRACEMALLOC))
+
+    def start(self):
+        """전체 실행 계측 시작"""
+        if not self.enabled:
+            return
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+        if self.trace_memory:
+            import tracemalloc
+            tracemalloc.start()
+        if self.cprofile:
+            import cProfile
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def stop(self):
+        """전체 실행 계측 종료"""
+        if not self.enabled or self._start_wall is None:
+            return
+        if self._profile is not None:
+            self._profile.disable()
+        if self.trace_memory:
+            import tracemalloc
+            if tracemalloc.is_tracing():
+                self.peak_traced = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+        self.total_wall = time.perf_counter() - self._start_wall
+        self.total_cpu = time.process_time() - self._start_cpu
+        self._start_wall = None
+
+    @contextmanager
+    def profile_thread(self):
+        """현재 스레드 cProfile 수집 (cProfile은 enable한 스레드만 기록하므로 단계 스레드마다 실행)"""
+        if self._profile is None:
+            yield
+            return
+        import cProfile
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+는 프로파일러가 프로세스 전체에 하나 - 전체 스레드가 이미 기록됨
+            yield
+            return
+        try:
+            yield
+        finally:
+            profile.disable()
+            with self._lock:
+                self._thread_profiles.append(profile)
+
+    @contextmanager
+    def measure(self, stage, file_path=None):
+        """단계(및 파일) 구간 계측 - stat의 records/bytes에 처리량 기록"""
+        stat = {'records': 0, 'bytes': 0}
+        if not self.enabled:
+            yield stat
+            return
+        
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield stat
+        finally:
+            stat['wall'] = time.perf_counter() - wall
+            stat['cpu'] = time.thread_time() - cpu
+            self._accumulate(self.stages, stage, stat)
+            if file_path is not None:
+                self._accumulate(self.files, (stage, file_path), stat)
+
+    def _accumulate(self, target, key, stat):
+        with self._lock:
+            entry = target.get(key)
+            if entry is None:
+                entry = target[key] = {'calls': 0, 'wall': 0.0, 'cpu': 0.0,
+                                       'records': 0, 'bytes': 0}
+            entry['calls'] += 1
+            entry['wall'] += stat['wall']
+            entry['cpu'] += stat['cpu']
+            entry['records'] += stat['records']
+            entry['bytes'] += stat['bytes']
+
+    def peak_rss_kb(self):
+        """프로세스 최대 RSS (KB, 측정 불가 시 None)"""
+        if resource is None:
+            return windows_peak_rss_kb() if sys.platform == "win32" else None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+
+    def report(self):
+        """JSON 직렬화 가능한 실행 리포트"""
+        with self._lock:
+            stages = {name: dict(entry) for name, entry in self.stages.items()}
+            files = [dict(entry, stage=stage, file=file_path)
+                     for (stage, file_path), entry in self.files.items()]
+        files.sort(key=lambda entry: entry['wall'], reverse=True)
+        
+        return {
+            'enabled': self.enabled,
+            'total': {'wall': self.total_wall, 'cpu': self.total_cpu},
+            'stages': stages,
+            'files': files,
+            'peak_memory': {
+                'traced_bytes': self.peak_traced,
+                'max_rss_kb': self.peak_rss_kb()
+            },
+            'cprofile': self._profile is not None
+        }
+
+    def summary_lines(self):
+        """진행 로그용 단계별 요약"""
+        lines = [f"총 소요: {self.total_wall:.2f}초 (CPU {self.total_cpu:.2f}초)"]
+        for name, entry in self.stages.items():
+            lines.append(f"- {name}: {entry['wall']:.2f}초 (CPU {entry['cpu']:.2f}초), "
+                         f"{entry['records']}건, {entry['bytes'] / 1048576:.1f}MB")
+        return lines
+
+    def write_report(self, save_dir, extra=None):
+        """결과 폴더에 리포트(및 프로파일) 저장 - extra는 리포트에 추가할 항목"""
+        report = self.report()
+        if extra:
+            report.update(extra)
+        import json
+        report_path = os.path.join(save_dir, self.REPORT_FILE)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        
+        if self._profile is not None:
+            import pstats
+            with open(os.path.join(save_dir, self.PROFILE_TEXT_FILE), 'w', encoding='utf-8') as f:
+                # 작업 스레드와 단계 스레드 프로파일 병합
+                stats = pstats.Stats(self._profile, stream=f)
+                with self._lock:
+                    thread_profiles = list(self._thread_profiles)
+                for profile in thread_profiles:
+                    stats.add(profile)
+                stats.dump_stats(os.path.join(save_dir, self.PROFILE_FILE))
+                stats.sort_stats('cumulative').print_stats(50)
+        return report_path
+
+
+# 레코드 종류별 필수 필드
+STRING_REQUIRED_FIELDS = ("id", "name", "body")
+STRING_EMPTY_ALLOWED = ("body",)  # 빈 본문도 정상 스트링
+ITEM_REQUIRED_FIELDS = ("id",)
+NPC_REQUIRED_FIELDS = ("id",)
+
+
+def child_text(elem, tag, default="Unknown"):
+    """하위 요소 텍스트 (없거나 비어 있으면 기본값)"""
+    child = elem.find(tag)
+    if child is None or child.text is None:
+        return default
+    return child.text
+
+
+def validate_record(elem, required, allow_empty=()):
+    """필수 필드 검사 - 예외 없이 (값 목록, 실패 사유) 반환 (allow_empty 필드는 빈 값 허용)"""
+    values = []
+    for tag in required:
+        child = elem.find(tag)
+        if child is None:
+            return None, f"필수 필드 누락: {tag}"
+        text = child.text
+        if tag in allow_empty:
+            values.append(text or "")
+            continue
+        if text is None or not text.strip():
+            return None, f"필수 필드 비어 있음: {tag}"
+        values.append(text)
+    return values, None
+
+
+def find_record_lines(file_path, tag, ordinals):
+    """레코드 순번 -> 파일 내 줄 번호 (오류가 있는 파일만 1회 스캔)"""
+    wanted = sorted(set(ordinals))
+    lines = {}
+    if not wanted or os.path.getsize(file_path) == 0:
+        return lines
+    
+    import mmap
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        codec, _, unit = sniff_xml_encoding(data[:1024])
+        pattern = record_start_pattern(tag, codec)
+        newline = "\n".encode(codec)
+        line = 1
+        pos = 0
+        index = 0
+        ordinal = -1
+        for match in pattern.finditer(data):
+            start = match.start()
+            if start % unit:
+                continue
+            ordinal += 1
+            if ordinal != wanted[index]:
+                continue
+            line += data[pos:start].count(newline)
+            pos = start
+            lines[ordinal] = line
+            index += 1
+            if index == len(wanted):
+                break
+        match = None  # mmap을 닫기 전에 버퍼 참조 해제
+    return lines
+
+
+def read_string_element(string):
+    """스트링 레코드 1개 읽기 - ((이름, 본문), 실패 사유)"""
+    fields, reason = validate_record(string, STRING_REQUIRED_FIELDS, STRING_EMPTY_ALLOWED)
+    if reason is not None:
+        return None, reason
+    return (fields[1], fields[2]), None
+
+
+def read_item_element(item):
+    """아이템 레코드 1개 읽기 (스트링 연결 전 원본 코드)"""
+    fields, reason = validate_record(item, ITEM_REQUIRED_FIELDS)
+    if reason is not None:
+        return None, reason
+    return {
+        'id': fields[0],
+        'name_code': child_text(item, "name"),
+        'desc_code': child_text(item, "desc"),
+        'icon': child_text(item, "icon_name"),
+        'type': child_text(item, "item_type"),
+        'quality': child_text(item, "quality"),
+        'level': child_text(item, "level"),
+        'equipment_slots': child_text(item, "equipment_slots"),
+        'category': child_text(item, "category")
+    }, None
+
+
+def read_npc_element(npc):
+    """NPC 레코드 1개 읽기"""
+    fields, reason = validate_record(npc, NPC_REQUIRED_FIELDS)
+    if reason is not None:
+        return None, reason
+    return {
+        'id': fields[0],
+        'name': child_text(npc, "name"),
+        'title': child_text(npc, "title"),
+        'desc': child_text(npc, "desc"),
+        'icon': child_text(npc, "icon_name"),
+        'type': child_text(npc, "npc_type")
+    }, None
+
+
+def read_quest_element(quest):
+    """퀘스트 레코드 1개 읽기"""
+    quest_id = quest.get("id")
+    if not quest_id:
+        return None, "필수 속성 누락: id"
+    return {
+        'id': quest_id,
+        'name': child_text(quest, "name"),
+        'desc': child_text(quest, "desc"),
+        'category': child_text(quest, "category"),
+        'level': child_text(quest, "level")
+    }, None
+
+
+# 파일 종류별 레코드 태그와 읽기 함수
+XML_KIND_TAGS = {
+    'string': 'string',
+    'client_item': 'item',
+    'client_npc': 'npc',
+    'quest': 'quest'
+}
+RECORD_TAGS = {kind: tag for tag, kind in XML_KIND_TAGS.items()}
+ELEMENT_READERS = {
+    'string': read_string_element,
+    'item': read_item_element,
+    'npc': read_npc_element,
+    'quest': read_quest_element
+}
+
+
+def iter_record_batches(file_path, kind, batch_size=1000):
+    """XML 파일 스트리밍 파싱 - (레코드 목록, [(사유, 태그, 순번)]) 묶음 단위 반환"""
+    tag = RECORD_TAGS[kind]
+    reader = ELEMENT_READERS[kind]
+    records = []
+    errors = []
+    ordinal = 0
+    root = None
+    
+    with open(file_path, 'rb') as f:
+        parser = ET.XMLParser(encoding="utf-8")
+        try:
+            for event, elem in ET.iterparse(f, events=("start", "end"), parser=parser):
+                if root is None:
+                    root = elem
+                if event != "end" or elem.tag != tag:
+                    continue
+                
+                record, reason = reader(elem)
+                if reason is None:
+                    records.append(record)
+                else:
+                    errors.append((reason, tag, ordinal))
+                ordinal += 1
+                
+                # 처리한 레코드는 트리에서 제거해 메모리를 묶음 크기로 제한
+                elem.clear()
+                if len(records) + len(errors) >= batch_size:
+                    root.clear()
+                    yield records, errors
+                    records = []
+                    errors = []
+        except ET.ParseError:
+            # 오류 위치 앞까지 읽은 레코드는 전달 후 오류 보고
+            if records or errors:
+                yield records, errors
+            raise
+    
+    if records or errors:
+        yield records, errors
+
+
+def detect_xml_kind(file_path):
+    """XML 파일 종류 감지 - 첫 레코드 태그까지만 읽음 (알 수 없으면 None)"""
+    try:
+        with open(file_path, 'rb') as f:
+            for event, elem in ET.iterparse(f, events=("start",)):
+                kind = XML_KIND_TAGS.get(elem.tag)
+                if kind is not None:
+                    return kind
+        return None
+    except (ET.ParseError, ValueError):
+        # 파서가 읽지 못하는 파일(손상, 미지원 인코딩)은 앞부분 바이트에서 태그 탐색
+        kind = sniff_xml_kind(file_path)
+        if kind is None:
+            raise
+        return kind
+
+
+def sniff_xml_kind(file_path, head_size=1 << 20):
+    """파일 앞부분 바이트에서 가장 먼저 나오는 레코드 태그로 종류 추정"""
+    with open(file_path, 'rb') as f:
+        head = f.read(head_size)
+    codec, _, unit = sniff_xml_encoding(head)
+    found = None
+    for tag, kind in XML_KIND_TAGS.items():
+        for match in record_start_pattern(tag, codec).finditer(head):
+            if match.start() % unit == 0:
+                if found is None or match.start() < found[0]:
+                    found = (match.start(), kind)
+                break
+    return found[1] if found else None
+
+
+# 바이트 순서 표시(BOM) -> (코덱, 문자 단위 바이트 수) - UTF-32를 UTF-16보다 먼저 검사
+XML_BOMS = (
+    (b"\xff\xfe\x00\x00", 'utf-32-le', 4),
+    (b"\x00\x00\xfe\xff", 'utf-32-be', 4),
+    (b"\xef\xbb\xbf", 'utf-8', 1),
+    (b"\xff\xfe", 'utf-16-le', 2),
+    (b"\xfe\xff", 'utf-16-be', 2),
+)
+XML_DECLARATION_ENCODING = re.compile(rb"""<\?xml[^>]*?encoding\s*=\s*["']([A-Za-z0-9._-]+)["']""")
+
+
+def sniff_xml_encoding(head):
+    """BOM 또는 XML 선언으로 인코딩 감지 - (코덱, BOM 길이, 문자 단위 바이트 수)"""
+    import codecs
+    head = bytes(head)
+    for bom, codec, unit in XML_BOMS:
+        if head.startswith(bom):
+            return codec, len(bom), unit
+    
+    # BOM 없는 UTF-16 ('<' 뒤/앞이 0 바이트)
+    if head.startswith(b"<\x00") and not head.startswith(b"<\x00\x00\x00"):
+        return 'utf-16-le', 0, 2
+    if head.startswith(b"\x00<") and not head.startswith(b"\x00\x00"):
+        return 'utf-16-be', 0, 2
+    
+    match = XML_DECLARATION_ENCODING.match(head.lstrip())
+    if match:
+        try:
+            codec = codecs.lookup(match.group(1).decode('ascii')).name
+        except LookupError:
+            codec = None
+        # BOM 없이 선언만 UTF-16/32인 파일은 실제로는 1바이트 계열로 저장된 것
+        if codec and not codec.startswith(('utf-16', 'utf-32')):
+            return codec, 0, 1
+    return 'utf-8', 0, 1
+
+
+def record_start_pattern(tag, codec):
+    """인코딩된 바이트에서 레코드 시작 태그를 찾는 정규식"""
+    delimiters = b"|".join(re.escape(ch.encode(codec)) for ch in " \t\r\n/>")
+    return re.compile(re.escape(("<" + tag).encode(codec)) + b"(?:" + delimiters + b")")
+
+
+def _find_aligned(data, needle, start, end, base, unit):
+    """문자 경계(unit 배수)에 맞는 위치만 찾기 - 없으면 -1"""
+    pos = data.find(needle, start, end)
+    while pos >= 0 and (base + pos) % unit:
+        pos = data.find(needle, pos + 1, end)
+    return pos
+
+
+def _search_aligned(data, pattern, start, unit):
+    """문자 경계에 맞는 첫 정규식 일치 위치 - 없으면 -1 (mmap 버퍼를 잡는 일치 객체는 남기지 않음)"""
+    match = pattern.search(data, start)
+    while match is not None:
+        pos = match.start()
+        if pos % unit == 0:
+            return pos
+        match = pattern.search(data, pos + 1)
+    return -1
+
+
+def plan_record_chunks(file_path, kind, codec, unit, chunk_size):
+    """파일을 레코드 시작 위치에서 나눈 바이트 구간 목록 [(시작, 끝)]"""
+    import mmap
+    size = os.path.getsize(file_path)
+    if size == 0:
+        return []
+    pattern = record_start_pattern(RECORD_TAGS[kind], codec)
+    boundaries = [0]
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        target = chunk_size
+        while target < size:
+            start = _search_aligned(data, pattern, target, unit)
+            if start < 0:
+                break
+            if start > boundaries[-1]:
+                boundaries.append(start)
+            target = max(target + chunk_size, start + 1)
+    boundaries.append(size)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def scan_record_chunk(task):
+    """바이트 구간의 레코드를 하나씩 독립 파싱 (프로세스 풀 작업) - [(구간 내 순번, 레코드, 실패 사유)]"""
+    file_path, start, end, kind, codec, unit = task
+    tag = RECORD_TAGS[kind]
+    reader = ELEMENT_READERS[kind]
+    pattern = record_start_pattern(tag, codec)
+    end_tag = ("</" + tag + ">").encode(codec)
+    tag_close = ">".encode(codec)
+    empty_close = "/>".encode(codec)
+    
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    starts = [match.start() for match in pattern.finditer(data) if (start + match.start()) % unit == 0]
+    
+    results = []
+    for index, pos in enumerate(starts):
+        limit = starts[index + 1] if index + 1 < len(starts) else len(data)
+        # 시작 태그가 '/>'로 끝나면 자체로 완결된 레코드, 아니면 끝 태그까지
+        open_end = _find_aligned(data, tag_close, pos, limit, start, unit)
+        if open_end < 0:
+            results.append((index, None, "레코드 끝 태그 없음"))
+            continue
+        record_end = open_end + len(tag_close)
+        if data[record_end - len(empty_close):record_end] != empty_close:
+            close = _find_aligned(data, end_tag, open_end, limit, start, unit)
+            if close < 0:
+                results.append((index, None, "레코드 끝 태그 없음"))
+                continue
+            record_end = close + len(end_tag)
+        try:
+            text = data[pos:record_end].decode(codec)
+        except UnicodeDecodeError:
+            results.append((index, None, "레코드 인코딩 오류"))
+            continue
+        try:
+            elem = ET.fromstring(text)
+        except ET.ParseError:
+            results.append((index, None, "레코드 XML 파싱 오류"))
+            continue
+        record, reason = reader(elem)
+        results.append((index, record, reason))
+    return results
+
+
+def iter_recovered_batches(file_path, kind, executor=None, batch_size=1000, chunk_size=8 << 20,
+                           skip=0, window=4):
+    """복구 스캔 - 레코드 단위로 독립 파싱해 손상된 레코드만 오류 처리 (executor가 있으면 구간 병렬)"""
+    tag = RECORD_TAGS[kind]
+    with open(file_path, 'rb') as f:
+        codec, _, unit = sniff_xml_encoding(f.read(1024))
+    tasks = iter([(file_path, start, end, kind, codec, unit)
+                  for start, end in plan_record_chunks(file_path, kind, codec, unit, chunk_size)])
+    
+    # 결과를 기다리는 구간 수를 window개로 제한해 메모리 사용량 유지
+    pending = []
+    
+    def submit_next():
+        task = next(tasks, None)
+        if task is None:
+            return
+        if executor is None:
+            pending.append(task)
+        else:
+            pending.append(executor.submit(scan_record_chunk, task))
+    
+    for _ in range(max(window, 1)):
+        submit_next()
+    
+    base = 0  # 구간 첫 레코드의 파일 내 순번
+    while pending:
+        job = pending.pop(0)
+        results = scan_record_chunk(job) if executor is None else job.result()
+        submit_next()
+        
+        records = []
+        errors = []
+        for index, record, reason in results:
+            ordinal = base + index
+            if ordinal < skip:
+                continue
+            if reason is None:
+                records.append(record)
+            else:
+                errors.append((reason, tag, ordinal))
+            if len(records) + len(errors) >= batch_size:
+                yield records, errors
+                records = []
+                errors = []
+        base += len(results)
+        if records or errors:
+            yield records, errors
+
+
+def _scan_directory(directory):
+    """디렉토리 한 단계 탐색 - (파일 목록, 하위 디렉토리 목록)"""
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def _match_any(path, folder, patterns, is_dir=False):
+    """파일/폴더 이름 또는 폴더 기준 상대 경로가 패턴 중 하나와 일치하는지"""
+    name = os.path.basename(path)
+    rel_path = os.path.relpath(path, folder).replace(os.sep, "/")
+    # 앞에 '/'를 붙여 '*/backup/*'가 최상위 backup 폴더에도 일치하도록 함
+    candidates = [name, rel_path, "/" + rel_path]
+    if is_dir:
+        candidates += [rel_path + "/", "/" + rel_path + "/"]
+    return any(fnmatch.fnmatch(candidate, pattern)
+               for pattern in patterns for candidate in candidates)
+
+
+def scan_xml_folder(folder, include=("*.xml",), exclude=(), max_workers=8):
+    """폴더 재귀 탐색 (하위 디렉토리 병렬) - 정렬된 전체 경로 목록 반환"""
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+    include = [pattern for pattern in include if pattern] or ["*.xml"]
+    exclude = [pattern for pattern in exclude if pattern]
+    found = []
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(_scan_directory, folder)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                for path in files:
+                    if _match_any(path, folder, include) and not _match_any(path, folder, exclude):
+                        found.append(path)
+                for path in subdirs:
+                    if not _match_any(path, folder, exclude, is_dir=True):
+                        pending.add(executor.submit(_scan_directory, path))
+    
+    found.sort()
+    return found
+
+
+def split_patterns(text):
+    """쉼표/세미콜론 구분 패턴 문자열 -> 패턴 목록"""
+    return [pattern.strip() for pattern in re.split(r"[,;]", text) if pattern.strip()]
+
+
+def common_source_root(file_paths):
+    """파일들의 공통 상위 폴더 (파일이 없거나 드라이브가 다른 경로가 섞이면 None)"""
+    try:
+        return os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in file_paths])
+    except ValueError:
+        return None
+
+
+def source_display_names(file_paths, root=None):
+    """파일 경로 -> 표시 이름 (root 또는 공통 상위 폴더 기준 상대 경로 - 폴더가 하나면 파일 이름)"""
+    paths = list(file_paths)
+    if not paths:
+        return {}
+    if root is None:
+        root = common_source_root(paths)
+        if root is None:
+            # 드라이브가 다른 경로가 섞이면 전체 경로 사용
+            return {path: os.path.abspath(path) for path in paths}
+    names = {}
+    for path in paths:
+        try:
+            names[path] = os.path.relpath(path, root)
+        except ValueError:
+            names[path] = os.path.abspath(path)
+    return names
+
+
+def file_stamp(file_path):
+    """파일 변경 확인용 (수정 시각, 크기) - 파일이 없으면 None"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class ExtractionErrorLog:
+    """유효하지 않은 레코드/파일 기록 (상세 항목 수 제한)"""
+
+    def __init__(self, limit=1000, names=None):
+        self.limit = limit
+        self.names = names or {}  # 파일 경로 -> 표시 이름 (없으면 파일 이름)
+        self.entries = []      # 상세 오류 (최대 limit개)
+        self.total = 0
+        self.by_reason = {}    # 사유별 건수
+        self.by_file = {}      # 파일별 건수
+        self._pending = {}     # (파일 경로, 태그) -> 줄 번호 미확인 항목
+        self._lock = threading.Lock()
+
+    def add(self, file_path, reason, tag=None, ordinal=None, line=None):
+        """오류 기록 - 레코드 오류는 태그/순번으로 줄 번호를 나중에 계산"""
+        file_name = self.names.get(file_path) or os.path.basename(file_path)
+        with self._lock:
+            self.total += 1
+            self.by_reason[reason] = self.by_reason.get(reason, 0) + 1
+            self.by_file[file_name] = self.by_file.get(file_name, 0) + 1
+            if len(self.entries) >= self.limit:
+                return
+            
+            entry = {'file': file_name, 'line': line, 'reason': reason}
+            if tag is not None:
+                entry['record'] = tag
+                entry['index'] = ordinal
+                if line is None:
+                    self._pending.setdefault((file_path, tag), []).append(entry)
+            self.entries.append(entry)
+
+    def resolve_lines(self):
+        """보류된 레코드 오류의 줄 번호 계산"""
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+        
+        for (file_path, tag), entries in pending.items():
+            try:
+                lines = find_record_lines(file_path, tag, [entry['index'] for entry in entries])
+            except (OSError, ValueError):
+                continue
+            for entry in entries:
+                entry['line'] = lines.get(entry['index'])
+
+    def summary(self):
+        """JSON 직렬화 가능한 오류 요약"""
+        return {
+            'total': self.total,
+            'dropped': max(self.total - len(self.entries), 0),
+            'by_reason': dict(self.by_reason),
+            'by_file': dict(self.by_file),
+            'entries': list(self.entries)
+        }
+
+    def summary_lines(self, max_reasons=10):
+        """진행 로그용 오류 요약"""
+        if not self.total:
+            return ["오류 없음"]
+        lines = [f"총 오류: {self.total}건"]
+        reasons = sorted(self.by_reason.items(), key=lambda pair: pair[1], reverse=True)
+        for reason, count in reasons[:max_reasons]:
+            lines.append(f"- {reason}: {count}건")
+        for file_name, count in sorted(self.by_file.items()):
+            lines.append(f"- {file_name}: {count}건")
+        return lines
+
+
+class MergePolicy:
+    """여러 파일에 같은 ID/스트링 이름이 있을 때 채택할 파일 결정"""
+
+    PRIORITY = "priority"   # 파일 패턴 우선순위 (같은 순위면 경로순 마지막 파일)
+    NEWEST = "newest"       # 수정 시각이 가장 최근인 파일
+    KEEP_ALL = "keep_all"   # 우선순위로 대표값 선택 + 모든 버전 보관
+    MODES = (PRIORITY, NEWEST, KEEP_ALL)
+
+    # 정책 환경 변수
+    ENV_MODE = "AION_MERGE_POLICY"
+    ENV_PATTERNS = "AION_MERGE_PRIORITY"  # 쉼표 구분, 앞쪽 패턴이 우선
+
+    def __init__(self, mode=PRIORITY, patterns=()):
+        if mode not in self.MODES:
+            raise ValueError(f"알 수 없는 병합 정책: {mode}")
+        self.mode = mode
+        self.patterns = [pattern.strip() for pattern in patterns if pattern.strip()]
+        self.names = {}  # 파일 경로 -> 원본 폴더 기준 상대 경로 (패턴 비교용)
+        self._ranks = {}
+
+    @classmethod
+    def from_env(cls):
+        """환경 변수 기반 생성"""
+        mode = os.environ.get(cls.ENV_MODE, "").strip().lower() or cls.PRIORITY
+        if mode not in cls.MODES:
+            mode = cls.PRIORITY
+        return cls(mode, os.environ.get(cls.ENV_PATTERNS, "").split(","))
+
+    def set_source_names(self, names):
+        """패턴 비교에 쓸 상대 경로 지정 (source_display_names 결과) - 계산된 순위 초기화"""
+        self.names = dict(names)
+        self._ranks.clear()
+
+    def rank(self, file_path):
+        """파일 순위 (클수록 우선) - 파일별 1회 계산"""
+        rank = self._ranks.get(file_path)
+        if rank is None:
+            path_key = os.path.normcase(os.path.abspath(file_path))
+            if self.mode == self.NEWEST:
+                try:
+                    mtime = os.path.getmtime(file_path)
+                except OSError:
+                    mtime = 0.0
+                rank = (mtime, path_key)
+            else:
+                rank = (self.pattern_priority(file_path), path_key)
+            self._ranks[file_path] = rank
+        return rank
+
+    def pattern_priority(self, file_path):
+        """일치하는 첫 패턴의 우선도 (앞쪽 패턴일수록 큼, 불일치 0)"""
+        # 파일 이름, 원본 폴더 기준 상대 경로('ko/*' 등), 전체 경로 순으로 비교
+        candidates = [os.path.basename(file_path)]
+        rel_path = self.names.get(file_path)
+        if rel_path is not None:
+            rel_path = rel_path.replace(os.sep, "/")
+            candidates += [rel_path, "/" + rel_path]
+        candidates.append(file_path)
+        for index, pattern in enumerate(self.patterns):
+            if any(fnmatch.fnmatch(candidate, pattern) for candidate in candidates):
+                return len(self.patterns) - index
+        return 0
+
+    def wins(self, new_path, current_path):
+        """new_path의 값이 current_path의 값을 대체하는지 여부"""
+        return self.rank(new_path) > self.rank(current_path)
+
+
+class ProvenanceIndex:
+    """키별 채택 파일 기록 및 병합 정책 적용"""
+
+    def __init__(self, policy, conflict_limit=1000, names=None):
+        self.policy = policy
+        self.conflict_limit = conflict_limit
+        self.names = names or {}  # 파일 경로 -> 표시 이름 (없으면 전체 경로)
+        self.sources = {}     # 종류 -> {키: 채택된 파일 경로}
+        self.versions = {}    # keep_all: 종류 -> {키: [(파일 경로, 값)]} (정의된 순서)
+        self.conflicts = []   # 상세 충돌 (최대 conflict_limit개)
+        self.conflict_counts = {}  # 종류별 충돌 건수
+
+    def merge(self, kind, store, key, value, file_path):
+        """store[key]에 정책을 적용해 값 반영 - 채택되면 True"""
+        sources = self.sources.get(kind)
+        if sources is None:
+            sources = self.sources[kind] = {}
+        
+        current_path = sources.get(key)
+        if current_path is None:
+            sources[key] = file_path
+            store[key] = value
+            return True
+        
+        # 같은 파일 안의 재정의는 뒤쪽 값 채택 (파일 단위 로드 순서와 동일)
+        adopted = current_path == file_path or self.policy.wins(file_path, current_path)
+        self._record_conflict(kind, key, current_path, file_path, adopted)
+        if self.policy.mode == MergePolicy.KEEP_ALL:
+            # 같은 파일 안의 중복 정의도 각각 보관
+            versions = self.versions.setdefault(kind, {}).setdefault(key, [])
+            if not versions:
+                versions.append((current_path, store[key]))
+            versions.append((file_path, value))
+        
+        if adopted:
+            sources[key] = file_path
+            store[key] = value
+        return adopted
+
+    def source_of(self, kind, key):
+        """키를 채택한 파일 경로"""
+        return self.sources.get(kind, {}).get(key)
+
+    def _record_conflict(self, kind, key, current_path, file_path, adopted):
+        self.conflict_counts[kind] = self.conflict_counts.get(kind, 0) + 1
+        if len(self.conflicts) < self.conflict_limit:
+            winner, loser = (file_path, current_path) if adopted else (current_path, file_path)
+            self.conflicts.append({
+                'kind': kind,
+                'key': key,
+                'winner': self.names.get(winner) or winner,
+                'loser': self.names.get(loser) or loser
+            })
+
+    def summary(self):
+        """JSON 직렬화 가능한 충돌 요약"""
+        return {
+            'policy': self.policy.mode,
+            'patterns': list(self.policy.patterns),
+            'total': sum(self.conflict_counts.values()),
+            'by_kind': dict(self.conflict_counts),
+            'entries': list(self.conflicts)
+        }
+
+    def summary_lines(self):
+        """진행 로그용 충돌 요약"""
+        total = sum(self.conflict_counts.values())
+        if not total:
+            return ["중복 정의 없음"]
+        lines = [f"중복 정의: {total}건 (정책: {self.policy.mode})"]
+        for kind, count in sorted(self.conflict_counts.items()):
+            lines.append(f"- {kind}: {count}건")
+        return lines
+
+
+class FileRecordCache:
+    """파일별 추출 레코드 캐시 - 변경 없는 파일은 증분 재추출 시 다시 파싱하지 않음"""
+
+    def __init__(self):
+        self._entries = {}  # 파일 경로 -> (stamp, 종류, 레코드, 오류)
+        self._lock = threading.Lock()
+
+    def get(self, file_path, kind):
+        """유효한 캐시 (레코드, 오류) - 없거나 파일이 바뀌었으면 None"""
+        with self._lock:
+            entry = self._entries.get(file_path)
+        if entry is None or entry[1] != kind or entry[0] != file_stamp(file_path):
+            return None
+        return entry[2], entry[3]
+
+    def put(self, file_path, kind, stamp, records, errors):
+        """파싱 직전에 확인한 stamp로 레코드 저장"""
+        if stamp is None:
+            return
+        with self._lock:
+            self._entries[file_path] = (stamp, kind, records, errors)
+
+    def prune(self, file_paths):
+        """목록에 없는 파일의 캐시 제거"""
+        keep = set(file_paths)
+        with self._lock:
+            for file_path in [path for path in self._entries if path not in keep]:
+                del self._entries[file_path]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class StringPool:
+    """내용 기준 문자열 풀 - 같은 내용의 문자열은 한 객체만 남기고 레코드가 공유"""
+
+    def __init__(self):
+        self._index = {}  # 내용 -> 대표 객체
+        self.lookups = 0
+        self.unique = 0
+        self.duplicates = 0    # 대표 객체로 대체된 중복 문자열 수
+        self.saved_bytes = 0   # 대체로 해제되는 중복 문자열 크기
+        self.unique_bytes = 0
+
+    def intern(self, value):
+        """같은 내용의 대표 문자열 반환 (처음 보는 내용이면 등록)"""
+        if not isinstance(value, str):
+            return value
+        self.lookups += 1
+        canonical = self._index.get(value)
+        if canonical is None:
+            self._index[value] = value
+            self.unique += 1
+            self.unique_bytes += sys.getsizeof(value)
+            return value
+        if canonical is not value:
+            self.duplicates += 1
+            self.saved_bytes += sys.getsizeof(value)
+        return canonical
+
+    def intern_fields(self, record, fields):
+        """레코드(dict)의 지정 필드를 대표 문자열로 교체"""
+        for field in fields:
+            if field in record:
+                record[field] = self.intern(record[field])
+        return record
+
+    def clear(self):
+        """색인 해제 (레코드가 참조하는 대표 문자열은 유지)"""
+        self._index.clear()
+
+    def summary(self):
+        """JSON 직렬화 가능한 요약"""
+        return {
+            'lookups': self.lookups,
+            'unique': self.unique,
+            'duplicates': self.duplicates,
+            'unique_bytes': self.unique_bytes,
+            'saved_bytes': self.saved_bytes
+        }
+
+    def summary_lines(self):
+        """진행 로그용 요약"""
+        if not self.lookups:
+            return ["공유된 문자열 없음"]
+        return [f"고유 문자열: {self.unique}개 ({self.unique_bytes / 1048576:.1f}MB)",
+                f"중복 제거: {self.duplicates}개 ({self.saved_bytes / 1048576:.1f}MB 절약)"]
+
+
+def format_record(info):
+    """결과 파일용 레코드 텍스트"""
+    lines = [f"ID: {info['id']}"]
+    if 'name_code' in info:
+        lines.append(f"이름 코드: {info['name_code']}")
+        lines.append(f"이름: {info['name']}")
+    if 'desc_code' in info:
+        lines.append(f"설명 코드: {info['desc_code']}")
+        lines.append(f"설명: {info['desc']}")
+    for key, value in info.items():
+        if key not in ['id', 'name_code', 'desc_code', 'name', 'desc']:
+            lines.append(f"{key}: {value}")
+    lines.append("-" * 30)
+    return "\n".join(lines) + "\n"
+
+
+class ResultWriter:
+    """카테고리별 결과 파일 스트리밍 저장 (항목 수는 닫을 때 헤더에 기록)"""
+
+    COUNT_WIDTH = 32  # 헤더의 항목 수 자리 (바이트)
+
+    def __init__(self, save_dir):
+        self.save_dir = save_dir
+        self._files = {}   # 카테고리 -> (파일, 항목 수 위치)
+        self.counts = {}
+
+    def _open(self, category):
+        save_path = os.path.join(self.save_dir, f'{category}_info.txt')
+        f = open(save_path, 'wb')
+        f.write(f"=== {category.upper()} 정보 ===\n\n".encode('utf-8'))
+        count_offset = f.tell()
+        f.write(b" " * self.COUNT_WIDTH + b"\n")
+        f.write(("-" * 50 + "\n\n").encode('utf-8'))
+        self._files[category] = (f, count_offset)
+        self.counts[category] = 0
+        return f
+
+    def write(self, category, records, override_source=None):
+        """레코드 묶음 추가 - override_source가 있으면 앞서 기록한 항목을 대체하는 재정의 구역으로 기록"""
+        entry = self._files.get(category)
+        f = entry[0] if entry is not None else self._open(category)
+        if override_source is not None:
+            # 같은 파일 안에서 다시 정의된 ID - 항목 수에는 포함하지 않음
+            f.write(f"\n=== 재정의: {override_source} ({len(records)}개, 앞의 같은 ID 항목을 대체) ===\n\n"
+                    .encode('utf-8'))
+        else:
+            self.counts[category] += len(records)
+        f.write("".join(format_record(info) for info in records).encode('utf-8'))
+
+    def close(self):
+        """항목 수 기록 후 파일 닫기"""
+        for category, (f, count_offset) in self._files.items():
+            f.seek(count_offset)
+            f.write(f"총 {self.counts[category]}개 항목".encode('utf-8').ljust(self.COUNT_WIDTH))
+            f.close()
+        self._files.clear()
+
+
+class FolderWatcher(QThread):
+    """폴더 변경 감시 (폴링) - 변경이 멈춘 뒤 변경 파일 목록 전달"""
+    changed = pyqtSignal(list)
+
+    def __init__(self, folder, include, exclude, interval=2.0):
+        super().__init__()
+        self.folder = folder
+        self.include = include
+        self.exclude = exclude
+        self.interval = interval
+
+    def snapshot(self):
+        """감시 대상 파일별 stamp"""
+        snapshot = {}
+        for file_path in scan_xml_folder(self.folder, self.include, self.exclude):
+            stamp = file_stamp(file_path)
+            if stamp is not None:
+                snapshot[file_path] = stamp
+        return snapshot
+
+    def wait_interval(self):
+        """감시 간격만큼 대기 (중단 요청 시 즉시 종료)"""
+        remaining = int(self.interval * 1000)
+        while remaining > 0 and not self.isInterruptionRequested():
+            self.msleep(min(remaining, 200))
+            remaining -= 200
+
+    def run(self):
+        previous = self.snapshot()
+        changed = set()
+        
+        while not self.isInterruptionRequested():
+            self.wait_interval()
+            if self.isInterruptionRequested():
+                break
+            
+            current = self.snapshot()
+            if current != previous:
+                # 복사 중인 파일이 안정될 때까지 한 주기 더 대기
+                changed.update(path for path in set(previous) | set(current)
+                               if previous.get(path) != current.get(path))
+                previous = current
+            elif changed:
+                self.changed.emit(sorted(changed))
+                changed = set()
+
+    def stop(self):
+        """감시 종료"""
+        self.requestInterruption()
+        self.wait()
+
+
+# 이전 추출 결과 캐시 (다음 실행 시 검색용으로 백그라운드 로드)
+RESULTS_CACHE_FILE = "results_cache.pickle"
+RESULTS_CACHE_VERSION = 1
+
+
+def default_results_dir():
+    """결과 저장 폴더"""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def save_results_cache(save_dir, results):
+    """추출 결과 캐시 저장 (임시 파일에 쓴 뒤 교체)"""
+    import pickle
+    cache_path = os.path.join(save_dir, RESULTS_CACHE_FILE)
+    temp_path = cache_path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        pickle.dump({'version': RESULTS_CACHE_VERSION, 'results': results}, f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, cache_path)
+
+
+def load_results_cache(cache_path):
+    """추출 결과 캐시 로드 (없거나 형식이 다르면 None)"""
+    import pickle
+    try:
+        with open(cache_path, 'rb') as f:
+            payload = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(payload, dict) or payload.get('version') != RESULTS_CACHE_VERSION:
+        return None
+    return payload.get('results')
+
+
+class CachedResultsLoader(QThread):
+    """이전 추출 결과 캐시 백그라운드 로드"""
+    loaded = pyqtSignal(dict)
+
+    def __init__(self, cache_path):
+        super().__init__()
+        self.cache_path = cache_path
+
+    def run(self):
+        results = load_results_cache(self.cache_path)
+        if results is not None:
+            self.loaded.emit(results)
+
+
+# 파이프라인 단계 사이 종료 표시
+_PIPELINE_END = object()
+
+
+class PipelineAborted(Exception):
+    """다른 단계 오류로 파이프라인 중단"""
+
 
 class DataExtractorWorker(QThread):
     progress = pyqtSignal(str)
     finished = pyqtSignal(dict)
 
-    def __init__(self, xml_files, icon_dir):
+    BATCH_SIZE = 1000  # 파이프라인 묶음당 레코드 수
+    QUEUE_SIZE = 8     # 단계 사이 큐에 대기할 수 있는 묶음 수
+    
+    # 파일 읽기 방식: auto(스트리밍, 실패/대용량/비 UTF-8 파일은 복구 스캔), stream, recover
+    ENV_SCAN_MODE = "AION_EXTRACTOR_SCAN_MODE"
+    ENV_SCAN_WORKERS = "AION_EXTRACTOR_SCAN_WORKERS"
+    SCAN_MODES = ("auto", "stream", "recover")
+    
+    # 문자열 풀로 공유할 필드 (레코드마다 값이 다른 ID는 제외, 스트링은 이름/본문 모두)
+    POOLED_FIELDS = {
+        'item': ("name_code", "desc_code", "icon", "type", "quality", "level", "equipment_slots",
+                 "category"),
+        'npc': ("name", "title", "desc", "icon", "type"),
+        'quest': ("name", "desc", "category", "level")
+    }
+    SCAN_CHUNK_SIZE = 8 << 20  # 복구 스캔 구간 크기
+
+    def __init__(self, xml_files, icon_dir, merge_policy=None, file_kinds=None, record_cache=None,
+                 save_dir=None, source_root=None):
         super().__init__()
-        self.xml_files = xml_files
+        self.xml_files = sorted(xml_files)
+        
+        # 로그/결과에 쓰는 파일 이름 (여러 폴더의 같은 이름 파일 구분)
+        self.source_names = source_display_names(self.xml_files, source_root)
+        self.save_dir = save_dir  # 결과 파일 저장 위치 (None이면 저장하지 않음)
+        self.file_kinds = dict(file_kinds or {})  # 파일 경로 -> 종류 (string/item/npc/quest/None)
+        
+        # 증분 재추출용 파일별 레코드 캐시
+        self.record_cache = record_cache
+        self.cached_files = 0
         
         # 파일 분류 저장
         self.string_files = []
@@ -65,6 +1290,35 @@ class DataExtractorWorker(QThread):
                 'misc': [],       # 기타
             }
         }
+        
+        # 실행 계측 및 오류 기록
+        self.profiler = RunProfiler.from_env()
+        self.errors = ExtractionErrorLog(names=self.source_names)
+        
+        # 중복 키 병합 정책 및 출처 기록
+        merge_policy = merge_policy or MergePolicy.from_env()
+        merge_policy.set_source_names(self.source_names)
+        self.provenance = ProvenanceIndex(merge_policy, names=self.source_names)
+        
+        # 스트링 본문/반복 필드 중복 제거
+        self.string_pool = StringPool()
+        
+        # 복구 스캔 설정 (프로세스 풀은 처음 필요할 때 생성)
+        self.scan_mode = os.environ.get(self.ENV_SCAN_MODE, "").strip().lower()
+        if self.scan_mode not in self.SCAN_MODES:
+            self.scan_mode = "auto"
+        try:
+            self.scan_workers = int(os.environ.get(self.ENV_SCAN_WORKERS, ""))
+        except ValueError:
+            self.scan_workers = 0
+        if self.scan_workers <= 0:
+            # 측정상 프로세스 풀이 순차 복구보다 빠른 경우가 없어 기본은 순차 처리 (README 참고)
+            self.scan_workers = 1
+        self.scan_pool = None
+
+    def source_name(self, file_path):
+        """파일 표시 이름 (입력 폴더 기준 상대 경로)"""
+        return self.source_names.get(file_path) or os.path.basename(file_path)
 
     def classify_xml_files(self):
         """선택된 XML 파일 분류"""
@@ -76,23 +1330,24 @@ class DataExtractorWorker(QThread):
         
         for file in self.xml_files:
             try:
-                parser = ET.XMLParser(encoding="utf-8")
-                tree = ET.parse(file, parser=parser)
-                root = tree.getroot()
+                # 파일 타입 확인 (GUI에서 이미 분류한 파일은 재사용)
+                kind = self.file_kinds.get(file)
+                if kind is None:
+                    kind = detect_xml_kind(file)
+                    self.file_kinds[file] = kind
                 
-                # 파일 타입 확인
-                if root.find(".//string") is not None:
+                if kind == 'string':
                     self.string_files.append(file)
-                    self.progress.emit(f"스트링 파일 발견: {os.path.basename(file)}")
-                elif root.find(".//client_item") is not None:
+                    self.progress.emit(f"스트링 파일 발견: {self.source_name(file)}")
+                elif kind == 'item':
                     self.item_files.append(file)
-                    self.progress.emit(f"아이템 파일 발견: {os.path.basename(file)}")
+                    self.progress.emit(f"아이템 파일 발견: {self.source_name(file)}")
                 else:
                     self.other_files.append(file)
-                    self.progress.emit(f"기타 파일 발견: {os.path.basename(file)}")
+                    self.progress.emit(f"기타 파일 발견: {self.source_name(file)}")
                     
             except Exception as e:
-                self.progress.emit(f"파일 분류 중 오류 ({os.path.basename(file)}): {str(e)}")
+                self.record_file_error(file, e)
         
         # 분류 완료 메시지
         self.progress.emit(f"\n파일 분류 완료:")
@@ -100,109 +1355,358 @@ class DataExtractorWorker(QThread):
         self.progress.emit(f"- 아이템 파일: {len(self.item_files)}개")
         self.progress.emit(f"- 기타 파일: {len(self.other_files)}개")
 
-    def process_strings(self, root, file_name):
-        """스트링 데이터 처리"""
-        string_count = 0
+    def pipeline_jobs(self):
+        """파이프라인 처리 순서 - 스트링, 아이템, 기타 순이며 종류 안에서는 우선순위가 높은 파일부터"""
+        policy = self.provenance.policy
+        jobs = []
+        for files in (self.string_files, self.item_files, self.other_files):
+            for file in sorted(files, key=policy.rank, reverse=True):
+                kind = self.file_kinds.get(file)
+                if kind in RECORD_TAGS:
+                    jobs.append((file, kind))
+        return jobs
+
+    def scan_executor(self):
+        """복구 스캔용 프로세스 풀 (작업자 수가 1이면 None - 현재 스레드에서 순차 처리)"""
+        if self.scan_pool is None and self.scan_workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            self.scan_pool = ProcessPoolExecutor(max_workers=self.scan_workers)
+        return self.scan_pool
+
+    def close_scan_executor(self):
+        """복구 스캔 프로세스 풀 종료"""
+        if self.scan_pool is not None:
+            self.scan_pool.shutdown(wait=True, cancel_futures=True)
+            self.scan_pool = None
+
+    def iter_recovered(self, file_path, kind, skip=0):
+        """복구 스캔으로 레코드 묶음 읽기"""
+        yield from iter_recovered_batches(file_path, kind, self.scan_executor(), self.BATCH_SIZE,
+                                          self.SCAN_CHUNK_SIZE, skip=skip,
+                                          window=max(self.scan_workers, 1) * 2)
+
+    def iter_parsed_batches(self, file_path, kind):
+        """파일 파싱 - 읽기 방식에 따라 스트리밍 파싱 또는 복구 스캔"""
+        if self.scan_mode == "recover":
+            yield from self.iter_recovered(file_path, kind)
+            return
         
-        for string in root.findall(".//string"):
-            try:
-                id_elem = string.find("id")
-                name_elem = string.find("name")
-                body_elem = string.find("body")
-                
-                if id_elem is not None and name_elem is not None and body_elem is not None:
-                    string_id = id_elem.text
-                    name_text = name_elem.text
-                    body_text = body_elem.text
-                    
-                    # 스트링 데이터 저장
-                    self.strings[name_text] = body_text
-                    # 스트링 소스 파일 저장
-                    self.string_sources[name_text] = file_name
-                    string_count += 1
-                        
-            except Exception as e:
-                continue
-                
-        self.progress.emit(f"스트링 처리: {string_count}개")
+        if self.scan_mode == "auto":
+            with open(file_path, 'rb') as f:
+                codec = sniff_xml_encoding(f.read(1024))[0]
+            if codec != 'utf-8':
+                yield from self.iter_recovered(file_path, kind)
+                return
+        
+        read_count = 0  # 이미 전달한 레코드 수 (복구 스캔에서 건너뜀)
+        try:
+            for records, errors in iter_record_batches(file_path, kind, self.BATCH_SIZE):
+                read_count += len(records) + len(errors)
+                yield records, errors
+        except ET.ParseError as e:
+            if self.scan_mode == "stream":
+                raise
+            file_name = self.source_name(file_path)
+            self.progress.emit(f"XML 파싱 오류 ({file_name}): {str(e)}")
+            self.progress.emit(f"복구 스캔으로 {read_count}번째 레코드부터 다시 읽습니다.")
+            yield from self.iter_recovered(file_path, kind, skip=read_count)
+
+    def intern_records(self, kind, records):
+        """레코드의 반복 문자열을 풀의 대표 객체로 교체 (제자리 변경 - 캐시된 레코드도 공유)"""
+        intern = self.string_pool.intern
+        if kind == 'string':
+            records[:] = [(intern(name), intern(body)) for name, body in records]
+            return records
+        fields = self.POOLED_FIELDS.get(kind, ())
+        for record in records:
+            self.string_pool.intern_fields(record, fields)
+        return records
 
-    def process_item_data(self, root, file_name):
-        """아이템 데이터 처리"""
-        processed_count = 0
-        error_count = 0
-        name_not_found = 0
+    def iter_file_batches(self, file_path, kind):
+        """파일 레코드 묶음 읽기 - 변경 없는 파일은 캐시 재사용"""
+        if self.record_cache is None:
+            for records, errors in self.iter_parsed_batches(file_path, kind):
+                yield self.intern_records(kind, records), errors
+            return
         
-        # 스트링 파일 찾기
-        string_file = "Unknown"
-        for file in self.string_files:
-            if os.path.basename(file).startswith("string_"):
-                string_file = os.path.basename(file)
-                break
+        cached = self.record_cache.get(file_path, kind)
+        if cached is not None:
+            self.cached_files += 1
+            records, errors = cached
+            self.intern_records(kind, records)
+            for start in range(0, max(len(records), 1), self.BATCH_SIZE):
+                yield records[start:start + self.BATCH_SIZE], errors if start == 0 else []
+            return
         
-        for item in root.findall(".//client_item"):
+        # 캐시용으로 파일 전체 레코드 보관 (감시 모드에서만)
+        stamp = file_stamp(file_path)
+        all_records = []
+        all_errors = []
+        for records, errors in self.iter_parsed_batches(file_path, kind):
+            # 캐시에 넣기 전에 공유 - 캐시가 중복 문자열을 붙잡지 않도록
+            self.intern_records(kind, records)
+            all_records.extend(records)
+            all_errors.extend(errors)
+            yield records, errors
+        self.record_cache.put(file_path, kind, stamp, all_records, all_errors)
+
+    def pipeline_put(self, target, message):
+        """다음 단계 큐에 전달 - 큐가 차 있으면 대기 (역압)"""
+        while True:
             try:
-                id_elem = item.find("id")
-                if id_elem is None:
-                    continue
-                    
-                item_id = id_elem.text
-                item_info = self.extract_item_info(item, file_name)
-                
-                if item_info is not None:
-                    # 아이템 기본 정보 저장
-                    self.data_categories['items'][item_id] = item_info
-                    
-                    # 아이템 서브카테고리 분류
-                    self.categorize_item(item_info)
-                    
-                    processed_count += 1
-                else:
-                    error_count += 1
-                    
+                target.put(message, timeout=0.2)
+                return
+            except queue.Full:
+                if self._abort.is_set():
+                    raise PipelineAborted()
+
+    def pipeline_get(self, source):
+        """이전 단계 큐에서 꺼내기"""
+        while True:
+            try:
+                return source.get(timeout=0.2)
+            except queue.Empty:
+                if self._abort.is_set():
+                    raise PipelineAborted()
+
+    def parse_stage(self, jobs, target):
+        """파싱 단계 - 파일을 스트리밍 파싱해 레코드 묶음 전달"""
+        for file_path, kind in jobs:
+            try:
+                batches = self.iter_file_batches(file_path, kind)
+                size = os.path.getsize(file_path) if self.profiler.enabled else 0
+                while True:
+                    # 묶음 생성만 파싱 시간으로 계측, 큐 대기는 backpressure로 따로 기록
+                    with self.profiler.measure('parse', file_path) as stat:
+                        batch = next(batches, None)
+                        stat['bytes'] = size
+                        size = 0
+                        if batch is not None:
+                            stat['records'] = len(batch[0])
+                    if batch is None:
+                        break
+                    records, errors = batch
+                    with self.profiler.measure('backpressure', file_path):
+                        self.pipeline_put(target, ('batch', file_path, kind, records, errors))
+                self.pipeline_put(target, ('done', file_path, kind, None, None))
+            except PipelineAborted:
+                raise
             except Exception as e:
-                error_count += 1
+                self.pipeline_put(target, ('failed', file_path, kind, e, None))
+
+    def send_adopted(self, target, file_path, category, adopted, written, overrides):
+        """채택된 레코드 묶음을 바로 저장 단계로 전달 - 이 파일에서 이미 기록한 ID는 파일 끝까지 보류"""
+        written_ids = written.setdefault(file_path, {}).setdefault(category, set())
+        records = []
+        for info in adopted:
+            key = info['id']
+            if key in written_ids:
+                # 같은 파일 안의 재정의 (드묾) - 마지막 값만 보관
+                overrides.setdefault(file_path, {}).setdefault(category, {})[key] = info
+            else:
+                written_ids.add(key)
+                records.append(info)
+        if records:
+            with self.profiler.measure('backpressure', file_path):
+                self.pipeline_put(target, (category, records, None))
+
+    def flush_overrides(self, target, file_path, written, overrides):
+        """파일이 끝나면 같은 파일 안에서 재정의된 레코드 전달 (결과 파일 뒤쪽 재정의 구역)"""
+        written.pop(file_path, None)
+        by_category = overrides.pop(file_path, None)
+        if not by_category:
+            return
+        for category, by_key in by_category.items():
+            records = list(by_key.values())
+            for start in range(0, len(records), self.BATCH_SIZE):
+                with self.profiler.measure('backpressure', file_path):
+                    self.pipeline_put(target, (category, records[start:start + self.BATCH_SIZE],
+                                               self.source_name(file_path)))
+
+    def resolve_stage(self, source, target):
+        """연결 단계 - 스트링 병합, 레코드 스트링 연결/병합 후 채택된 레코드 전달"""
+        file_counts = {}  # 파일 경로 -> [레코드 수, 오류 수]
+        written = {}    # 파일 경로 -> {카테고리: 기록한 ID 집합}
+        overrides = {}  # 파일 경로 -> {카테고리: {ID: 재정의된 정보}} (파일이 끝날 때 전달)
+        while True:
+            message = self.pipeline_get(source)
+            if message is _PIPELINE_END:
+                return
+            action, file_path, kind, records, errors = message
+            
+            if action == 'failed':
+                self.record_file_error(file_path, records)
+                file_counts.pop(file_path, None)
+                self.flush_overrides(target, file_path, written, overrides)
                 continue
+            if action == 'done':
+                self.report_file_done(file_path, kind, *file_counts.pop(file_path, (0, 0)))
+                self.flush_overrides(target, file_path, written, overrides)
+                continue
+            
+            counts = file_counts.setdefault(file_path, [0, 0])
+            counts[0] += len(records)
+            counts[1] += len(errors)
+            self.log_record_errors(file_path, errors)
+            
+            if kind == 'string':
+                with self.profiler.measure('strings', file_path) as stat:
+                    self.process_strings(file_path, records)
+                    stat['records'] = len(records)
+                continue
+            
+            if kind == 'item':
+                category = 'items'
+                with self.profiler.measure('resolve', file_path) as stat:
+                    adopted = self.process_item_data(file_path, records)
+                    stat['records'] = len(records)
+            else:
+                category = 'npcs' if kind == 'npc' else 'quests'
+                with self.profiler.measure('other', file_path) as stat:
+                    if kind == 'npc':
+                        adopted = self.process_npc_data(file_path, records)
+                    else:
+                        adopted = self.process_quest_data(file_path, records)
+                    stat['records'] = len(records)
+            
+            if adopted:
+                self.send_adopted(target, file_path, category, adopted, written, overrides)
 
-        # 최종 처리 결과 보고
-        self.progress.emit(f"아이템 처리: {processed_count}개 (실패: {error_count}개)")
+    def write_stage(self, source, target):
+        """저장 단계 - 채택된 레코드를 도착하는 대로 결과 파일에 기록"""
+        writer = ResultWriter(self.save_dir) if self.save_dir else None
+        try:
+            while True:
+                message = self.pipeline_get(source)
+                if message is _PIPELINE_END:
+                    return
+                if writer is None:
+                    continue
+                category, records, override_source = message
+                with self.profiler.measure('write') as stat:
+                    writer.write(category, records, override_source)
+                    stat['records'] = len(records)
+        finally:
+            if writer is not None:
+                writer.close()
 
-    def extract_item_info(self, item, file_name):
-        """아이템 정보 추출"""
+    def run_stage(self, stage, source, target):
+        """단계 실행 - 종료 시 다음 단계에 끝 표시 전달, 오류 시 전체 중단"""
         try:
-            item_id = item.find("id").text if item.find("id") is not None else "Unknown"
-            name_elem = item.find("name")
-            desc_elem = item.find("desc")
-            
-            # 이름과 설명 가져오기
-            name_code = name_elem.text if name_elem is not None else "Unknown"
-            desc_code = desc_elem.text if desc_elem is not None else "Unknown"
-            
-            # 스트링에서 실제 텍스트 찾기
-            item_name = self.strings.get(name_code, name_code)
-            item_desc = self.strings.get(desc_code, desc_code)
-            
-            # 스트링 파일 찾기
-            string_file = self.string_sources.get(name_code, "Unknown")
-            if string_file == "Unknown" and desc_code in self.string_sources:
-                string_file = self.string_sources[desc_code]
-            
-            return {
-                'id': item_id,
-                'name_code': name_code,
-                'name': item_name,
-                'desc_code': desc_code,
-                'desc': item_desc,
-                'icon': item.find("icon_name").text if item.find("icon_name") is not None else "Unknown",
-                'type': item.find("item_type").text if item.find("item_type") is not None else "Unknown",
-                'quality': item.find("quality").text if item.find("quality") is not None else "Unknown",
-                'level': item.find("level").text if item.find("level") is not None else "Unknown",
-                'equipment_slots': item.find("equipment_slots").text if item.find("equipment_slots") is not None else "Unknown",
-                'category': item.find("category").text if item.find("category") is not None else "Unknown",
-                'item_file': file_name,
-                'string_file': string_file
-            }
-        except Exception:
-            return None
+            with self.profiler.profile_thread():
+                stage(source, target)
+        except PipelineAborted:
+            pass
+        except Exception as e:
+            self._stage_error = e
+            self._abort.set()
+        finally:
+            if target is not None:
+                try:
+                    self.pipeline_put(target, _PIPELINE_END)
+                except PipelineAborted:
+                    pass
+
+    def run_pipeline(self):
+        """파싱 → 연결 → 저장 단계를 동시에 실행 (메모리는 큐 크기로 제한)"""
+        self._abort = threading.Event()
+        self._stage_error = None
+        parsed = queue.Queue(maxsize=self.QUEUE_SIZE)
+        resolved = queue.Queue(maxsize=self.QUEUE_SIZE)
+        
+        stages = [
+            threading.Thread(target=self.run_stage, args=(self.parse_stage, self.pipeline_jobs(), parsed),
+                             name="extract-parse", daemon=True),
+            threading.Thread(target=self.run_stage, args=(self.resolve_stage, parsed, resolved),
+                             name="extract-resolve", daemon=True),
+            threading.Thread(target=self.run_stage, args=(self.write_stage, resolved, None),
+                             name="extract-write", daemon=True)
+        ]
+        for stage in stages:
+            stage.start()
+        for stage in stages:
+            stage.join()
+        
+        if self._stage_error is not None:
+            raise self._stage_error
+
+    def report_file_done(self, file_path, kind, record_count, error_count):
+        """파일 처리 완료 보고"""
+        if kind == 'string':
+            self.progress.emit(f"스트링 처리: {record_count}개")
+        elif kind == 'item':
+            self.progress.emit(f"아이템 처리: {record_count}개 (실패: {error_count}개)")
+        else:
+            self.progress.emit(f"파일 처리 완료: {self.source_name(file_path)} ({record_count}개)")
+
+    def log_record_errors(self, file_path, errors):
+        """레코드 검증 오류 기록"""
+        for reason, tag, ordinal in errors:
+            self.errors.add(file_path, reason, tag, ordinal)
+
+    def process_strings(self, file_path, records):
+        """스트링 데이터 처리"""
+        file_name = self.source_name(file_path)
+        for name_text, body_text in records:
+            # 스트링 데이터 저장 (중복 시 병합 정책 적용)
+            if self.provenance.merge('strings', self.strings, name_text, body_text, file_path):
+                # 스트링 소스 파일 저장
+                self.string_sources[name_text] = file_name
+
+    def process_item_data(self, file_path, records):
+        """아이템 데이터 처리 - 채택된 아이템 정보 목록 반환"""
+        file_name = self.source_name(file_path)
+        items = self.data_categories['items']
+        adopted = []
+        for record in records:
+            # 아이템 정보 스트링 연결 (중복 시 병합 정책 적용)
+            item_info = self.extract_item_info(record, file_name)
+            if self.provenance.merge('items', items, record['id'], item_info, file_path):
+                adopted.append(item_info)
+        return adopted
+
+    def categorize_items(self):
+        """병합이 끝난 아이템 전체 서브카테고리 분류"""
+        for sub_cats in self.item_subcategories.values():
+            for items in sub_cats.values():
+                items.clear()
+        
+        items = self.data_categories['items']
+        with self.profiler.measure('categorize') as stat:
+            for item_info in items.values():
+                self.categorize_item(item_info)
+            stat['records'] = len(items)
+
+    def extract_item_info(self, record, file_name):
+        """아이템 정보 추출 (이름/설명 스트링 연결)"""
+        name_code = record['name_code']
+        desc_code = record['desc_code']
+        
+        # 스트링에서 실제 텍스트 찾기
+        item_name = self.strings.get(name_code, name_code)
+        item_desc = self.strings.get(desc_code, desc_code)
+        
+        # 스트링 파일 찾기
+        string_file = self.string_sources.get(name_code, "Unknown")
+        if string_file == "Unknown" and desc_code in self.string_sources:
+            string_file = self.string_sources[desc_code]
+        
+        # 문자열은 파싱 단계에서 풀의 대표 객체로 교체되어 있음
+        return {
+            'id': record['id'],
+            'name_code': name_code,
+            'name': item_name,
+            'desc_code': desc_code,
+            'desc': item_desc,
+            'icon': record['icon'],
+            'type': record['type'],
+            'quality': record['quality'],
+            'level': record['level'],
+            'equipment_slots': record['equipment_slots'],
+            'category': record['category'],
+            'item_file': file_name,
+            'string_file': string_file
+        }
 
     def categorize_item(self, item_info):
         """아이템 서브카테고리 분류"""
@@ -237,80 +1741,69 @@ class DataExtractorWorker(QThread):
         else:
             self.item_subcategories['other']['misc'].append(item_info)
 
-    def process_npc_data(self, root, file_name):
-        """NPC 데이터 처리"""
-        for npc in root.findall(".//client_npc"):
-            try:
-                id_elem = npc.find("id")
-                if id_elem is None:
-                    continue
-                    
-                npc_id = id_elem.text
-                self.data_categories['npcs'][npc_id] = {
-                    'id': npc_id,
-                    'name': npc.find("name").text if npc.find("name") is not None else "Unknown",
-                    'title': npc.find("title").text if npc.find("title") is not None else "Unknown",
-                    'desc': npc.find("desc").text if npc.find("desc") is not None else "Unknown",
-                    'desc_text': self.strings.get(npc.find("desc").text if npc.find("desc") is not None else "", "Unknown"),
-                    'icon': npc.find("icon_name").text if npc.find("icon_name") is not None else "Unknown",
-                    'type': npc.find("npc_type").text if npc.find("npc_type") is not None else "Unknown",
-                    'file': file_name
-                }
-            except Exception as e:
-                self.progress.emit(f"NPC 처리 중 오류 (ID: {npc_id}): {str(e)}")
+    def process_npc_data(self, file_path, records):
+        """NPC 데이터 처리 - 채택된 NPC 정보 목록 반환"""
+        file_name = self.source_name(file_path)
+        npcs = self.data_categories['npcs']
+        adopted = []
+        for record in records:
+            npc_info = dict(record)
+            npc_info['desc_text'] = self.strings.get(record['desc'], "Unknown")
+            npc_info['file'] = file_name
+            if self.provenance.merge('npcs', npcs, record['id'], npc_info, file_path):
+                adopted.append(npc_info)
+        return adopted
 
-    def process_quest_data(self, root, file_name):
-        """퀘스트 데이터 처리"""
-        for quest in root.findall(".//quest"):
-            try:
-                id_elem = quest.get("id")
-                if id_elem is None:
-                    continue
-                    
-                quest_id = id_elem
-                self.data_categories['quests'][quest_id] = {
-                    'id': quest_id,
-                    'name': quest.find("name").text if quest.find("name") is not None else "Unknown",
-                    'desc': quest.find("desc").text if quest.find("desc") is not None else "Unknown",
-                    'desc_text': self.strings.get(quest.find("desc").text if quest.find("desc") is not None else "", "Unknown"),
-                    'category': quest.find("category").text if quest.find("category") is not None else "Unknown",
-                    'level': quest.find("level").text if quest.find("level") is not None else "Unknown",
-                    'file': file_name
-                }
-            except Exception as e:
-                self.progress.emit(f"퀘스트 처리 중 오류 (ID: {quest_id}): {str(e)}")
+    def process_quest_data(self, file_path, records):
+        """퀘스트 데이터 처리 - 채택된 퀘스트 정보 목록 반환"""
+        file_name = self.source_name(file_path)
+        quests = self.data_categories['quests']
+        adopted = []
+        for record in records:
+            quest_info = dict(record)
+            quest_info['desc_text'] = self.strings.get(record['desc'], "Unknown")
+            quest_info['file'] = file_name
+            if self.provenance.merge('quests', quests, record['id'], quest_info, file_path):
+                adopted.append(quest_info)
+        return adopted
 
-    def parse_xml_file(self, file_path):
-        """XML 파일 파싱 및 분류"""
-        try:
-            self.progress.emit(f"파일 처리 중: {os.path.basename(file_path)}")
-            parser = ET.XMLParser(encoding="utf-8")
-            tree = ET.parse(file_path, parser=parser)
-            root = tree.getroot()
-            file_name = os.path.basename(file_path)
-            
-            # 파일 타입 자동 감지 및 처리
-            if root.find(".//string") is not None:
-                self.process_strings(root, file_name)
-            elif root.find(".//client_item") is not None:
-                self.process_item_data(root, file_name)
-            elif root.find(".//client_npc") is not None:
-                self.process_npc_data(root, file_name)
-            elif root.find(".//quest") is not None:
-                self.process_quest_data(root, file_name)
-            # 추가 타입들은 여기에 구현...
-            
-        except ET.ParseError as e:
-            self.progress.emit(f"XML 파싱 오류 ({os.path.basename(file_path)}): {str(e)}")
-            self.progress.emit("해당 파일을 건너뜁니다.")
-        except Exception as e:
-            self.progress.emit(f"파일 처리 중 오류 발생 ({os.path.basename(file_path)}): {str(e)}")
+    def record_file_error(self, file_path, error):
+        """파일 단위 오류 기록"""
+        file_name = self.source_name(file_path)
+        if isinstance(error, ET.ParseError):
+            line = error.position[0] if error.position else None
+            self.errors.add(file_path, "XML 파싱 오류", line=line)
+            self.progress.emit(f"XML 파싱 오류 ({file_name}): {str(error)}")
+            self.progress.emit("해당 파일의 나머지 레코드를 건너뜁니다.")
+        else:
+            self.errors.add(file_path, f"파일 처리 오류: {type(error).__name__}")
+            self.progress.emit(f"파일 처리 중 오류 발생 ({file_name}): {str(error)}")
+
+    def save_versions(self):
+        """모든 버전 보관 정책의 중복 정의 저장"""
+        versions = self.provenance.versions
+        if not versions or not self.save_dir:
+            return
+        save_path = os.path.join(self.save_dir, 'versions_info.txt')
+        with open(save_path, 'w', encoding='utf-8') as f:
+            f.write("=== 중복 정의 버전 ===\n\n")
+            for kind, keys in versions.items():
+                f.write(f"\n=== {kind} ({len(keys)}개) ===\n")
+                for key, entries in keys.items():
+                    f.write(f"\nID: {key}\n")
+                    for file_path, value in entries:
+                        if isinstance(value, dict):
+                            value = value.get('name', value.get('id'))
+                        f.write(f"{self.source_name(file_path)}: {value}\n")
+                    f.write("-" * 20 + "\n")
 
     def run(self):
         """메인 실행 함수"""
+        self.profiler.start()
         try:
             # XML 파일 분류
-            self.classify_xml_files()
+            with self.profiler.measure('classify'):
+                self.classify_xml_files()
             
             if not self.string_files:
                 self.progress.emit("경고: 스트링 파일이 없습니다!")
@@ -320,93 +1813,319 @@ class DataExtractorWorker(QThread):
                 self.progress.emit("경고: 아이템 파일이 없습니다!")
                 return
             
-            # 먼저 스트링 파일 처리
-            self.progress.emit("\n스트링 파일 처리 중...")
-            for file in self.string_files:
-                try:
-                    parser = ET.XMLParser(encoding="utf-8")
-                    tree = ET.parse(file, parser=parser)
-                    root = tree.getroot()
-                    self.process_strings(root, os.path.basename(file))
-                except Exception:
-                    continue
-
-            # 아이템 파일 처리
-            self.progress.emit("\n아이템 파일 처리 중...")
-            for file in self.item_files:
+            # 파싱/연결/저장 파이프라인 (스트링 → 아이템 → 기타 순서)
+            self.progress.emit("\n파일 처리 중...")
+            self.run_pipeline()
+            
+            if self.record_cache is not None:
+                self.record_cache.prune(self.xml_files)
+                self.progress.emit(f"\n변경 없는 파일 재사용: {self.cached_files}개")
+            
+            # 아이템 서브카테고리 분류
+            self.categorize_items()
+            
+            # 다음 실행 시 바로 검색할 수 있도록 결과 캐시 저장
+            if self.save_dir:
                 try:
-                    parser = ET.XMLParser(encoding="utf-8")
-                    tree = ET.parse(file, parser=parser)
-                    root = tree.getroot()
-                    self.process_item_data(root, os.path.basename(file))
-                except Exception:
-                    continue
+                    with self.profiler.measure('write'):
+                        save_results_cache(self.save_dir, {'categories': self.data_categories})
+                except Exception as e:
+                    self.progress.emit(f"결과 캐시 저장 중 오류: {str(e)}")
             
-            # 기타 파일 처리
-            if self.other_files:
-                self.progress.emit("\n기타 파일 처리 중...")
-                for file in self.other_files:
-                    try:
-                        self.parse_xml_file(file)
-                    except Exception:
-                        continue
+            # 중복 정의 요약
+            self.progress.emit("\n중복 정의 요약:")
+            for line in self.provenance.summary_lines():
+                self.progress.emit(line)
+            try:
+                self.save_versions()
+            except OSError as e:
+                self.progress.emit(f"중복 정의 저장 중 오류: {str(e)}")
+            
+            # 문자열 공유 요약 (색인은 해제, 레코드는 대표 문자열 참조 유지)
+            self.progress.emit("\n문자열 중복 제거:")
+            for line in self.string_pool.summary_lines():
+                self.progress.emit(line)
+            self.string_pool.clear()
+            
+            # 오류 요약
+            self.errors.resolve_lines()
+            self.progress.emit("\n오류 요약:")
+            for line in self.errors.summary_lines():
+                self.progress.emit(line)
             
             # 결과 데이터 생성
             result_data = {
                 'categories': self.data_categories,
                 'item_subcategories': self.item_subcategories,
                 'strings': self.strings,
-                'name_id_map': self.name_id_map
+                'name_id_map': self.name_id_map,
+                'errors': self.errors.summary(),
+                'conflicts': self.provenance.summary(),
+                'versions': self.provenance.versions,
+                'string_pool': self.string_pool.summary()
             }
             
+            self.profiler.stop()
+            if self.profiler.enabled:
+                self.progress.emit("\n단계별 소요 시간:")
+                for line in self.profiler.summary_lines():
+                    self.progress.emit(line)
+            
             self.finished.emit(result_data)
             
         except Exception as e:
             self.progress.emit(f"처리 중 오류 발생: {str(e)}")
+        finally:
+            self.close_scan_executor()
+            self.profiler.stop()
+
+
+def bitmap_from_positions(positions, size):
+    """레코드 위치 목록 -> 비트맵(int)"""
+    data = bytearray((size + 7) // 8)
+    for pos in positions:
+        data[pos >> 3] |= 1 << (pos & 7)
+    return int.from_bytes(data, 'little')
+
+
+def iter_bitmap(bitmap):
+    """비트맵에서 켜진 위치를 오름차순으로 반환"""
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little')
+    for byte_index, byte in enumerate(data):
+        while byte:
+            low = byte & -byte
+            yield (byte_index << 3) + low.bit_length() - 1
+            byte ^= low
 
-    def save_category_data(self, category, data, save_dir):
-        """카테고리별 데이터 저장"""
-        save_path = os.path.join(save_dir, f'{category}_info.txt')
+
+def tokenize_text(text):
+    """검색용 토큰 분리 (소문자, 단어 문자 기준)"""
+    if not isinstance(text, str):
+        return []
+    return re.findall(r"\w+", text.lower())
+
+
+def parse_number(text):
+    """숫자 변환 (실패 시 None)"""
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return None
+
+
+class SearchIndex:
+    """추출 레코드 검색 인덱스 - 필드별 비트맵, 숫자 정렬 색인, 전문 역색인"""
+
+    CATEGORICAL_FIELDS = ('type', 'quality', 'category', 'equipment_slots')
+    NUMERIC_FIELDS = ('level',)
+    TEXT_FIELDS = {'name': 2.0, 'desc': 1.0}  # 필드별 점수 가중치
+    SUBSTRING_FIELDS = ('id', 'name', 'desc', 'name_code', 'desc_code')
+
+    # 쿼리 필드 별칭
+    FIELD_ALIASES = {
+        '타입': 'type', '종류': 'type',
+        '등급': 'quality',
+        '카테고리': 'category',
+        '슬롯': 'equipment_slots', 'slot': 'equipment_slots', 'slots': 'equipment_slots',
+        '레벨': 'level', 'lv': 'level',
+        '이름': 'name',
+        '설명': 'desc',
+    }
+
+    QUERY_TOKEN = re.compile(
+        r'(?P<neg>-)?(?:(?P<field>[^\s:<>="-][^\s:<>="]*)(?P<op>:|>=|<=|>|<|=))?'
+        r'(?:"(?P<quoted>[^"]*)"?|(?P<word>\S+))')
+    RANGE_VALUE = re.compile(r'^(-?\d+(?:\.\d+)?)?\s*(?:\.\.|-|~)\s*(-?\d+(?:\.\d+)?)?$')
+
+    def __init__(self, records):
+        self.records = list(records)
+        self.size = len(self.records)
+        self.all_bits = (1 << self.size) - 1
         
-        with open(save_path, 'w', encoding='utf-8') as f:
-            f.write(f"=== {category.upper()} 정보 ===\n\n")
-            f.write(f"총 {len(data)}개 항목\n")
-            f.write("-" * 50 + "\n\n")
-            
-            for item_id, item_info in data.items():
-                f.write(f"ID: {item_id}\n")
-                if 'name_code' in item_info:
-                    f.write(f"이름 코드: {item_info['name_code']}\n")
-                    f.write(f"이름: {item_info['name']}\n")
-                if 'desc_code' in item_info:
-                    f.write(f"설명 코드: {item_info['desc_code']}\n")
-                    f.write(f"설명: {item_info['desc']}\n")
-                for key, value in item_info.items():
-                    if key not in ['id', 'name_code', 'desc_code', 'name', 'desc']:
-                        f.write(f"{key}: {value}\n")
-                f.write("-" * 30 + "\n")
-
-    def save_item_subcategories(self, subcategories, save_dir):
-        """아이템 서브카테고리 데이터 저장"""
-        save_path = os.path.join(save_dir, 'item_subcategories.txt')
+        self.bitmaps = {}   # 필드 -> {값(소문자): 비트맵}
+        self.numeric = {}   # 필드 -> ([정렬된 값], [위치])
+        self.postings = {}  # 토큰 -> {위치: 가중 빈도}
+        self.vocabulary = []
+        self._build()
+
+    def _build(self):
+        """인덱스 생성 (레코드 1회 순회)"""
+        value_positions = {field: {} for field in self.CATEGORICAL_FIELDS}
+        numeric_pairs = {field: [] for field in self.NUMERIC_FIELDS}
+        postings = self.postings
         
-        with open(save_path, 'w', encoding='utf-8') as f:
-            f.write("=== 아이템 상세 분류 ===\n\n")
-            
-            for main_cat, sub_cats in subcategories.items():
-                f.write(f"\n=== {main_cat} ===\n")
-                for sub_cat, items in sub_cats.items():
-                    if items:
-                        f.write(f"\n--- {sub_cat} ({len(items)}개) ---\n")
-                        for item in items:
-                            f.write(f"\nID: {item['id']}\n")
-                            if 'name_code' in item:
-                                f.write(f"이름 코드: {item['name_code']}\n")
-                                f.write(f"이름: {item['name']}\n")
-                            if 'desc_code' in item:
-                                f.write(f"설명 코드: {item['desc_code']}\n")
-                                f.write(f"설명: {item['desc']}\n")
-                            f.write("-" * 20 + "\n")
+        for pos, record in enumerate(self.records):
+            for field in self.CATEGORICAL_FIELDS:
+                value = record.get(field)
+                if isinstance(value, str):
+                    value_positions[field].setdefault(value.lower(), []).append(pos)
+            for field in self.NUMERIC_FIELDS:
+                number = parse_number(record.get(field))
+                if number is not None:
+                    numeric_pairs[field].append((number, pos))
+            for field, weight in self.TEXT_FIELDS.items():
+                for token in tokenize_text(record.get(field)):
+                    entry = postings.get(token)
+                    if entry is None:
+                        entry = postings[token] = {}
+                    entry[pos] = entry.get(pos, 0.0) + weight
+        
+        for field, values in value_positions.items():
+            self.bitmaps[field] = {value: bitmap_from_positions(positions, self.size)
+                                   for value, positions in values.items()}
+        for field, pairs in numeric_pairs.items():
+            pairs.sort()
+            self.numeric[field] = ([number for number, pos in pairs], [pos for number, pos in pairs])
+        self.vocabulary = sorted(postings)
+
+    def parse_query(self, query):
+        """쿼리 문자열 -> (필터 목록, 전문 검색어 목록)"""
+        filters = []
+        terms = []
+        for match in self.QUERY_TOKEN.finditer(query):
+            negate = bool(match.group('neg'))
+            value = match.group('quoted')
+            if value is None:
+                value = match.group('word')
+            field = match.group('field')
+            
+            if field is None:
+                for token in tokenize_text(value):
+                    terms.append((token, negate))
+                continue
+            
+            field = self.FIELD_ALIASES.get(field.lower(), field.lower())
+            op = match.group('op')
+            if field in self.NUMERIC_FIELDS:
+                filters.append(('range', field, self._parse_range(op, value), negate))
+            elif op != ':' and op != '=':
+                raise ValueError(f"숫자 필드가 아닌 곳에 비교 연산자 사용: {field}{op}")
+            elif field in self.CATEGORICAL_FIELDS:
+                values = [part.strip().lower() for part in value.split(",") if part.strip()]
+                filters.append(('values', field, values, negate))
+            elif field in self.SUBSTRING_FIELDS:
+                filters.append(('contains', field, value.lower(), negate))
+            else:
+                raise ValueError(f"알 수 없는 검색 필드: {field}")
+        return filters, terms
+
+    def _parse_range(self, op, value):
+        """숫자 조건 -> (최소, 최대, 경계 제외 여부) (None은 제한 없음)"""
+        comparison = re.match(r'^(>=|<=|>|<)(.*)$', value)
+        if op in (':', '=') and comparison is not None:
+            op, value = comparison.groups()
+        if op in ('>=', '>', '<=', '<'):
+            number = parse_number(value)
+            if number is None:
+                raise ValueError(f"숫자가 아닌 범위 값: {value}")
+            if op == '>':
+                return (number, None, True)
+            if op == '<':
+                return (None, number, True)
+            return (number, None, False) if op == '>=' else (None, number, False)
+        
+        number = parse_number(value)
+        if number is not None:
+            return (number, number, False)
+        match = self.RANGE_VALUE.match(value)
+        if match is None or match.group(1) is None and match.group(2) is None:
+            raise ValueError(f"잘못된 범위 값: {value}")
+        low, high = match.group(1), match.group(2)
+        return (parse_number(low) if low else None, parse_number(high) if high else None, False)
+
+    def _values_bitmap(self, field, values):
+        """범주형 필드 값 (와일드카드 가능) 비트맵 OR"""
+        field_bitmaps = self.bitmaps[field]
+        bits = 0
+        for value in values:
+            if any(char in value for char in "*?["):
+                for candidate, bitmap in field_bitmaps.items():
+                    if fnmatch.fnmatchcase(candidate, value):
+                        bits |= bitmap
+            else:
+                bits |= field_bitmaps.get(value, 0)
+        return bits
+
+    def _range_bitmap(self, field, bounds):
+        """숫자 범위 비트맵"""
+        low, high, exclusive = bounds
+        numbers, positions = self.numeric[field]
+        if low is None:
+            start = 0
+        else:
+            start = bisect.bisect_right(numbers, low) if exclusive else bisect.bisect_left(numbers, low)
+        if high is None:
+            end = len(numbers)
+        else:
+            end = bisect.bisect_left(numbers, high) if exclusive else bisect.bisect_right(numbers, high)
+        return bitmap_from_positions(positions[start:end], self.size)
+
+    def _term_matches(self, token):
+        """검색어와 일치하는 토큰별 가중치 (정확히 일치 1.0, 접두어 0.5)"""
+        matches = {}
+        if token in self.postings:
+            matches[token] = 1.0
+        index = bisect.bisect_left(self.vocabulary, token)
+        while index < len(self.vocabulary) and self.vocabulary[index].startswith(token):
+            candidate = self.vocabulary[index]
+            if candidate != token:
+                matches[candidate] = 0.5
+            index += 1
+        return matches
+
+    def search(self, query, limit=None):
+        """쿼리 실행 - (전체 결과 수, 관련도순 레코드 목록)"""
+        filters, terms = self.parse_query(query)
+        
+        # 비트맵 필터 (AND)
+        bits = self.all_bits
+        contains = []
+        for kind, field, value, negate in filters:
+            if kind == 'contains':
+                contains.append((field, value, negate))
+                continue
+            if kind == 'values':
+                field_bits = self._values_bitmap(field, value)
+            else:
+                field_bits = self._range_bitmap(field, value)
+            bits = bits & ~field_bits if negate else bits & field_bits
+            if not bits:
+                return 0, []
+        
+        # 전문 검색 (모든 검색어 포함, tf-idf 점수)
+        scores = None
+        for token, negate in terms:
+            term_scores = {}
+            for candidate, match_weight in self._term_matches(token).items():
+                entry = self.postings[candidate]
+                idf = math.log(1.0 + self.size / len(entry))
+                for pos, weight in entry.items():
+                    term_scores[pos] = term_scores.get(pos, 0.0) + weight * idf * match_weight
+            term_bits = bitmap_from_positions(term_scores, self.size)
+            if negate:
+                bits &= ~term_bits
+                continue
+            bits &= term_bits
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {pos: score + term_scores[pos] for pos, score in scores.items()
+                          if pos in term_scores}
+        
+        # 부분 문자열 필터 (후보에 대해서만 검사)
+        positions = list(iter_bitmap(bits))
+        if contains:
+            positions = [pos for pos in positions
+                         if all((value in str(self.records[pos].get(field, '')).lower()) != negate
+                                for field, value, negate in contains)]
+        
+        total = len(positions)
+        if scores is not None:
+            positions.sort(key=lambda pos: (-scores.get(pos, 0.0), pos))
+        if limit is not None:
+            positions = positions[:limit]
+        return total, [self.records[pos] for pos in positions]
+
 
 class ItemIconWidget(QWidget):
     def __init__(self, icon_path=None):
@@ -419,6 +2138,7 @@ class ItemIconWidget(QWidget):
             self.set_icon(icon_path)
 
     def set_icon(self, icon_path):
+        from PyQt5.QtGui import QPixmap
         try:
             pixmap = QPixmap(icon_path)
             if not pixmap.isNull():
@@ -430,6 +2150,8 @@ class ItemIconWidget(QWidget):
             self.icon_label.setText("Error")
 
 class ItemExtractorGUI(QMainWindow):
+    SEARCH_RESULT_LIMIT = 500  # 쿼리 검색 결과 표시 최대 수
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("아이온 데이터 추출기")
@@ -442,8 +2164,8 @@ class ItemExtractorGUI(QMainWindow):
         layout = QVBoxLayout(main_widget)
         
         # 탭 위젯 생성
-        tabs = QTabWidget()
-        layout.addWidget(tabs)
+        self.tabs = QTabWidget()
+        layout.addWidget(self.tabs)
         
         # XML 파일 탭
         xml_tab = QWidget()
@@ -457,6 +2179,11 @@ class ItemExtractorGUI(QMainWindow):
         xml_btn.clicked.connect(self.select_xml_files)
         button_layout.addWidget(xml_btn)
         
+        # 폴더 선택 버튼 (하위 폴더 포함)
+        folder_btn = QPushButton("폴더 선택")
+        folder_btn.clicked.connect(self.select_xml_folder)
+        button_layout.addWidget(folder_btn)
+        
         # 초기화 버튼
         reset_btn = QPushButton("초기화")
         reset_btn.clicked.connect(self.reset_all)
@@ -464,6 +2191,36 @@ class ItemExtractorGUI(QMainWindow):
         
         xml_layout.addLayout(button_layout)
         
+        # 폴더 탐색 필터와 감시 모드
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("포함"))
+        self.include_patterns = QLineEdit("*.xml")
+        filter_layout.addWidget(self.include_patterns)
+        filter_layout.addWidget(QLabel("제외"))
+        self.exclude_patterns = QLineEdit()
+        self.exclude_patterns.setPlaceholderText("예: */backup/*, *_old.xml")
+        filter_layout.addWidget(self.exclude_patterns)
+        self.watch_check = QCheckBox("폴더 감시")
+        self.watch_check.toggled.connect(self.toggle_watch)
+        filter_layout.addWidget(self.watch_check)
+        xml_layout.addLayout(filter_layout)
+        
+        # 중복 ID 병합 정책
+        merge_layout = QHBoxLayout()
+        merge_layout.addWidget(QLabel("중복 병합"))
+        self.merge_mode = QComboBox()
+        self.merge_mode.addItems(["우선순위 패턴", "최신 파일", "모든 버전 보관"])
+        merge_layout.addWidget(self.merge_mode)
+        self.merge_patterns = QLineEdit()
+        self.merge_patterns.setPlaceholderText("우선 파일 패턴 (쉼표 구분, 예: *_patch*.xml)")
+        merge_layout.addWidget(self.merge_patterns)
+        xml_layout.addLayout(merge_layout)
+        
+        # 환경 변수 기본값 반영
+        env_policy = MergePolicy.from_env()
+        self.merge_mode.setCurrentIndex(MergePolicy.MODES.index(env_policy.mode))
+        self.merge_patterns.setText(", ".join(env_policy.patterns))
+        
         # 파일 리스트를 표시할 위젯들
         lists_layout = QHBoxLayout()
         
@@ -492,37 +2249,15 @@ class ItemExtractorGUI(QMainWindow):
         lists_layout.addWidget(other_group)
         
         xml_layout.addLayout(lists_layout)
-        tabs.addTab(xml_tab, "XML 파일")
-        
-        # 검색 탭 추가
-        search_tab = QWidget()
-        search_layout = QVBoxLayout(search_tab)
-        
-        # 검색 옵션
-        search_option_layout = QHBoxLayout()
-        self.search_type = QComboBox()
-        self.search_type.addItems([
-            "아이템 ID", "아이템 이름", "NPC", "퀘스트", 
-            "펫", "탑승물", "날개", "스킬", "기타"
-        ])
-        search_option_layout.addWidget(self.search_type)
+        self.tabs.addTab(xml_tab, "XML 파일")
         
-        self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("검색어를 입력하세요...")
-        search_option_layout.addWidget(self.search_input)
-        
-        search_btn = QPushButton("검색")
-        search_btn.clicked.connect(self.search_data)
-        search_option_layout.addWidget(search_btn)
-        
-        search_layout.addLayout(search_option_layout)
-        
-        # 검색 결과 표시
-        self.search_result = QTextEdit()
-        self.search_result.setReadOnly(True)
-        search_layout.addWidget(self.search_result)
-        
-        tabs.addTab(search_tab, "검색")
+        # 검색 탭 (처음 선택할 때 생성)
+        self.search_type = None
+        self.search_input = None
+        self.search_result = None
+        self.lazy_tabs = {}  # 탭 인덱스 -> (탭 위젯, 생성 함수)
+        self.add_lazy_tab(self.build_search_tab, "검색")
+        self.tabs.currentChanged.connect(self.build_lazy_tab)
         
         # 진행상황 표시
         self.progress_text = QTextEdit()
@@ -552,17 +2287,163 @@ class ItemExtractorGUI(QMainWindow):
         process_btn.clicked.connect(self.start_processing)
         layout.addWidget(process_btn)
         
-        # 파일 리스트 저장
+        # 검색 대상 결과 (추출 완료 또는 이전 결과 캐시) 및 카테고리별 검색 인덱스
+        self.loaded_categories = None
+        self.search_indexes = {}
+        
+        # 파일 리스트 저장 (전체 경로)
         self.xml_files = []
+        self.file_kinds = {}      # 파일 경로 -> (stamp, 종류)
+        self.source_folder = None
+        self.source_root = None   # 표시 이름 기준 폴더 (폴더 선택 시 그 폴더, 아니면 공통 상위 폴더)
+        self.source_names = {}    # 파일 경로 -> 표시 이름
+        
+        # 폴더 감시 및 증분 재추출
+        self.watcher = None
+        self.record_cache = None
+        self.auto_run = False
+        self.rerun_pending = False
+        
+        # 창 표시 후 이전 추출 결과를 백그라운드로 로드
+        self.cache_loader = None
+        QTimer.singleShot(0, self.load_cached_results)
+
+    def add_lazy_tab(self, builder, title):
+        """처음 선택할 때 내용을 만드는 탭 추가 - builder(layout)"""
+        container = QWidget()
+        QVBoxLayout(container)
+        index = self.tabs.addTab(container, title)
+        self.lazy_tabs[index] = (container, builder)
+
+    def build_lazy_tab(self, index):
+        """지연 탭 내용 생성 (탭 선택 시 1회)"""
+        entry = self.lazy_tabs.pop(index, None)
+        if entry is not None:
+            container, builder = entry
+            builder(container.layout())
+
+    def build_search_tab(self, search_layout):
+        """검색 탭 구성"""
+        # 검색 옵션
+        search_option_layout = QHBoxLayout()
+        self.search_type = QComboBox()
+        self.search_type.addItems([
+            "아이템 ID", "아이템 이름", "아이템 쿼리", "NPC", "퀘스트", 
+            "펫", "탑승물", "날개", "스킬", "기타"
+        ])
+        search_option_layout.addWidget(self.search_type)
+        
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("검색어를 입력하세요...")
+        self.search_input.setToolTip(
+            "아이템 쿼리 예: type:weapon* level:55-65 quality:epic 검\n"
+            "필드: type, quality, category, equipment_slots (쉼표로 OR, * 와일드카드)\n"
+            "숫자: level:55-65, level>=55 / 부분 문자열: name:\"...\", desc:, id:\n"
+            "앞에 -를 붙이면 제외")
+        self.search_input.returnPressed.connect(self.search_data)
+        search_option_layout.addWidget(self.search_input)
+        
+        search_btn = QPushButton("검색")
+        search_btn.clicked.connect(self.search_data)
+        search_option_layout.addWidget(search_btn)
+        
+        search_layout.addLayout(search_option_layout)
+        
+        # 검색 결과 표시
+        self.search_result = QTextEdit()
+        self.search_result.setReadOnly(True)
+        search_layout.addWidget(self.search_result)
+
+    def load_cached_results(self):
+        """이전 추출 결과 캐시 백그라운드 로드 시작"""
+        cache_path = os.path.join(default_results_dir(), RESULTS_CACHE_FILE)
+        if not os.path.exists(cache_path):
+            return
+        self.cache_loader = CachedResultsLoader(cache_path)
+        self.cache_loader.loaded.connect(self.cached_results_loaded)
+        self.cache_loader.start()
+
+    def cached_results_loaded(self, results):
+        """캐시 로드 완료 - 그 사이 새로 추출한 결과가 없을 때만 사용"""
+        if self.loaded_categories is not None:
+            return
+        self.loaded_categories = results['categories']
+        self.search_indexes = {}
+        item_count = len(self.loaded_categories.get('items', {}))
+        self.progress_text.append(f"이전 추출 결과 로드: 아이템 {item_count}개 (검색 가능)")
 
     def select_xml_files(self):
         """XML 파일 선택"""
         files, _ = QFileDialog.getOpenFileNames(
             self, "XML 파일 선택", "", "XML Files (*.xml)")
         if files:
-            self.xml_files = files
+            self.stop_watch()
+            self.source_folder = None
+            self.xml_files = sorted(files)
             self.classify_xml_files()
 
+    def select_xml_folder(self):
+        """XML 폴더 선택 (하위 폴더 포함)"""
+        folder = QFileDialog.getExistingDirectory(self, "XML 폴더 선택", "")
+        if folder:
+            self.stop_watch()
+            self.source_folder = folder
+            self.scan_source_folder()
+            if self.watch_check.isChecked():
+                self.start_watch()
+
+    def scan_source_folder(self):
+        """선택한 폴더를 포함/제외 패턴으로 다시 탐색"""
+        self.progress_text.append(f"폴더 탐색 중: {self.source_folder}")
+        QApplication.processEvents()
+        self.xml_files = scan_xml_folder(
+            self.source_folder,
+            split_patterns(self.include_patterns.text()),
+            split_patterns(self.exclude_patterns.text())
+        )
+        self.progress_text.append(f"XML 파일 {len(self.xml_files)}개 발견")
+        self.classify_xml_files()
+
+    def toggle_watch(self, checked):
+        """폴더 감시 켜기/끄기"""
+        if checked:
+            if self.source_folder is None:
+                self.progress_text.append("폴더 감시는 폴더를 선택한 경우에만 사용할 수 있습니다.")
+                return
+            self.start_watch()
+        else:
+            self.stop_watch()
+
+    def start_watch(self):
+        """폴더 감시 시작"""
+        self.stop_watch()
+        if self.record_cache is None:
+            self.record_cache = FileRecordCache()
+        self.watcher = FolderWatcher(
+            self.source_folder,
+            split_patterns(self.include_patterns.text()),
+            split_patterns(self.exclude_patterns.text())
+        )
+        self.watcher.changed.connect(self.folder_changed)
+        self.watcher.start()
+        self.progress_text.append(f"폴더 감시 시작: {self.source_folder}")
+
+    def stop_watch(self):
+        """폴더 감시 종료"""
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+            self.progress_text.append("폴더 감시 종료")
+
+    def folder_changed(self, changed_files):
+        """감시 폴더 변경 시 증분 재추출"""
+        self.progress_text.append(f"\n폴더 변경 감지: {len(changed_files)}개 파일")
+        if hasattr(self, 'worker') and self.worker.isRunning():
+            self.rerun_pending = True
+            return
+        self.scan_source_folder()
+        self.start_processing(auto=True)
+
     def classify_xml_files(self):
         """선택된 XML 파일 분류"""
         self.string_list.clear()
@@ -575,26 +2456,35 @@ class ItemExtractorGUI(QMainWindow):
         self.progress_bar.setValue(0)
         self.progress_text.append("파일 분류 중...")
         
+        # 목록 표시 이름 - 추출 로그/결과와 같은 기준 폴더 사용
+        self.source_root = self.source_folder or common_source_root(self.xml_files)
+        self.source_names = source_display_names(self.xml_files, self.source_root)
+        
         for index, file in enumerate(self.xml_files, 1):
             try:
-                parser = ET.XMLParser(encoding="utf-8")
-                tree = ET.parse(file, parser=parser)
-                root = tree.getroot()
-                
-                # 파일 타입 확인
-                if root.find(".//string") is not None:
-                    self.string_list.addItem(os.path.basename(file))
-                elif root.find(".//client_item") is not None:
-                    self.item_list.addItem(os.path.basename(file))
+                # 파일 타입 확인 (변경 없는 파일은 이전 결과 사용)
+                stamp = file_stamp(file)
+                cached = self.file_kinds.get(file)
+                if cached is not None and cached[0] == stamp:
+                    kind = cached[1]
                 else:
-                    self.other_list.addItem(os.path.basename(file))
+                    kind = detect_xml_kind(file)
+                    self.file_kinds[file] = (stamp, kind)
                 
-                # 진행 상태 업데이트
-                self.progress_bar.setValue(index)
-                QApplication.processEvents()  # UI 업데이트
+                if kind == 'string':
+                    self.string_list.addItem(self.display_name(file))
+                elif kind == 'item':
+                    self.item_list.addItem(self.display_name(file))
+                else:
+                    self.other_list.addItem(self.display_name(file))
                     
             except Exception as e:
-                self.progress_text.append(f"파일 분류 중 오류 ({os.path.basename(file)}): {str(e)}")
+                self.file_kinds.pop(file, None)
+                self.progress_text.append(f"파일 분류 중 오류 ({self.display_name(file)}): {str(e)}")
+            
+            # 진행 상태 업데이트
+            self.progress_bar.setValue(index)
+            QApplication.processEvents()  # UI 업데이트
         
         # 분류 완료 메시지
         self.progress_text.append(f"\n파일 분류 완료:")
@@ -602,12 +2492,16 @@ class ItemExtractorGUI(QMainWindow):
         self.progress_text.append(f"- 아이템 파일: {self.item_list.count()}개")
         self.progress_text.append(f"- 기타 파일: {self.other_list.count()}개")
 
+    def display_name(self, file):
+        """목록 표시용 이름 (추출 작업과 같은 source_display_names 결과)"""
+        return self.source_names.get(file) or os.path.basename(file)
+
     def search_data(self):
         """데이터 검색"""
         search_text = self.search_input.text().strip().lower()
         search_type = self.search_type.currentText()
         
-        if not hasattr(self, 'worker'):
+        if self.loaded_categories is None:
             self.search_result.setText("먼저 데이터를 로드해주세요.")
             return
             
@@ -618,6 +2512,9 @@ class ItemExtractorGUI(QMainWindow):
             results = self.search_by_id(search_text, 'items')
         elif search_type == "아이템 이름":
             results = self.search_by_name(search_text, 'items')
+        elif search_type == "아이템 쿼리":
+            self.search_by_query(self.search_input.text().strip(), 'items')
+            return
         elif search_type == "NPC":
             results = self.search_by_name(search_text, 'npcs')
         elif search_type == "퀘스트":
@@ -638,7 +2535,7 @@ class ItemExtractorGUI(QMainWindow):
     def search_by_id(self, search_text, category):
         """ID로 검색"""
         results = []
-        category_data = self.worker.data_categories.get(category, {})
+        category_data = self.loaded_categories.get(category, {})
         
         for item_id, item_info in category_data.items():
             if search_text in str(item_id).lower():
@@ -649,7 +2546,7 @@ class ItemExtractorGUI(QMainWindow):
     def search_by_name(self, search_text, category):
         """이름으로 검색"""
         results = []
-        category_data = self.worker.data_categories.get(category, {})
+        category_data = self.loaded_categories.get(category, {})
         
         for item_info in category_data.values():
             # 이름과 설명에서 검색
@@ -664,14 +2561,34 @@ class ItemExtractorGUI(QMainWindow):
                 
         return results
 
-    def display_search_results(self, results, search_type):
-        """검색 결과 표시"""
+    def search_by_query(self, query, category):
+        """쿼리 검색 (필드 필터, 숫자 범위, 관련도순 전문 검색)"""
+        index = self.search_indexes.get(category)
+        if index is None:
+            started = time.perf_counter()
+            index = SearchIndex(self.loaded_categories.get(category, {}).values())
+            self.search_indexes[category] = index
+            self.progress_text.append(
+                f"검색 인덱스 생성: {index.size}개 항목 ({time.perf_counter() - started:.2f}초)")
+        
+        try:
+            total, results = index.search(query, limit=self.SEARCH_RESULT_LIMIT)
+        except ValueError as e:
+            self.search_result.setText(f"쿼리 오류: {str(e)}")
+            return
+        self.display_search_results(results, "아이템 쿼리", total)
+
+    def display_search_results(self, results, search_type, total=None):
+        """검색 결과 표시 (total: 표시 제한 전 전체 결과 수)"""
         if not results:
             self.search_result.setText("검색 결과가 없습니다.")
             return
             
         self.search_result.clear()
-        self.search_result.append(f"검색 결과: {len(results)}개 항목 발견\n")
+        if total is not None and total > len(results):
+            self.search_result.append(f"검색 결과: {total}개 항목 발견 (상위 {len(results)}개 표시)\n")
+        else:
+            self.search_result.append(f"검색 결과: {len(results)}개 항목 발견\n")
         self.search_result.append("-" * 40 + "\n")
         
         for item in results:
@@ -688,6 +2605,8 @@ class ItemExtractorGUI(QMainWindow):
             # 기타 정보 표시
             if 'type' in item:
                 self.search_result.append(f"타입: {item['type']}")
+            if 'quality' in item:
+                self.search_result.append(f"등급: {item['quality']}")
             if 'category' in item:
                 self.search_result.append(f"카테고리: {item['category']}")
             if 'level' in item:
@@ -698,8 +2617,8 @@ class ItemExtractorGUI(QMainWindow):
                 self.search_result.append(f"스트링 파일: {item['string_file']}")
             self.search_result.append("-" * 40 + "\n")
 
-    def start_processing(self):
-        """데이터 처리 시작"""
+    def start_processing(self, auto=False):
+        """데이터 처리 시작 (auto: 폴더 감시에 의한 재추출)"""
         if not self.xml_files:
             self.progress_text.append("오류: XML 파일을 선택해주세요.")
             return
@@ -719,24 +2638,30 @@ class ItemExtractorGUI(QMainWindow):
         self.extract_progress_bar.setMaximum(100)
         self.extract_progress_bar.setValue(0)
         
-        # XML 파일이 있는 디렉토리 경로
-        base_dir = os.path.dirname(self.xml_files[0])
+        # 결과 저장 디렉토리 생성
+        save_dir = default_results_dir()
+        if not os.path.exists(save_dir):
+            os.makedirs(save_dir)
         
-        # 분류된 파일 목록 생성
-        string_files = [os.path.join(base_dir, self.string_list.item(i).text()) 
-                       for i in range(self.string_list.count())]
-        item_files = [os.path.join(base_dir, self.item_list.item(i).text()) 
-                     for i in range(self.item_list.count())]
-        other_files = [os.path.join(base_dir, self.other_list.item(i).text()) 
-                      for i in range(self.other_list.count())]
+        # 분류 결과 (전체 경로 기준)
+        xml_files = [file for file in self.xml_files if file in self.file_kinds]
+        file_kinds = {file: self.file_kinds[file][1] for file in xml_files}
         
+        merge_policy = MergePolicy(
+            MergePolicy.MODES[self.merge_mode.currentIndex()],
+            split_patterns(self.merge_patterns.text())
+        )
+        
+        self.auto_run = bool(auto)
         self.worker = DataExtractorWorker(
-            self.xml_files,
-            ""
+            xml_files,
+            "",
+            merge_policy,
+            file_kinds,
+            self.record_cache,
+            save_dir,
+            self.source_root
         )
-        self.worker.string_files = string_files
-        self.worker.item_files = item_files
-        self.worker.other_files = other_files
         
         self.worker.progress.connect(self.update_progress)
         self.worker.finished.connect(self.process_complete)
@@ -764,71 +2689,54 @@ class ItemExtractorGUI(QMainWindow):
 
     def process_complete(self, results):
         """처리 완료"""
+        # 새 결과 기준으로 검색 인덱스 재생성
+        self.loaded_categories = results['categories']
+        self.search_indexes = {}
+        
         try:
-            # 결과 저장 디렉토리 생성
-            save_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
-            if not os.path.exists(save_dir):
-                os.makedirs(save_dir)
-            
-            # 카테고리별 결과 저장
-            for category, data in results['categories'].items():
-                if data:  # 데이터가 있는 경우만 저장
-                    try:
-                        save_path = os.path.join(save_dir, f'{category}_info.txt')
-                        with open(save_path, 'w', encoding='utf-8') as f:
-                            f.write(f"=== {category.upper()} 정보 ===\n\n")
-                            f.write(f"총 {len(data)}개 항목\n")
-                            f.write("-" * 50 + "\n\n")
-                            
-                            for item_id, item_info in data.items():
-                                f.write(f"ID: {item_id}\n")
-                                if 'name_code' in item_info:
-                                    f.write(f"이름 코드: {item_info['name_code']}\n")
-                                    f.write(f"이름: {item_info['name']}\n")
-                                if 'desc_code' in item_info:
-                                    f.write(f"설명 코드: {item_info['desc_code']}\n")
-                                    f.write(f"설명: {item_info['desc']}\n")
-                                for key, value in item_info.items():
-                                    if key not in ['id', 'name_code', 'desc_code', 'name', 'desc']:
-                                        f.write(f"{key}: {value}\n")
-                                f.write("-" * 30 + "\n")
-                    except Exception as e:
-                        self.progress_text.append(f"카테고리 {category} 저장 중 오류: {str(e)}")
-            
-            # 아이템 정보 저장
+            # 카테고리별 결과 파일은 추출 중 파이프라인에서 이미 저장됨
+            save_dir = self.worker.save_dir
+            profiler = self.worker.profiler
+            
+            # 실행 리포트 저장
             try:
-                save_path = os.path.join(save_dir, 'items_info.txt')
-                with open(save_path, 'w', encoding='utf-8') as f:
-                    f.write("=== 아이템 정보 ===\n\n")
-                    f.write(f"총 {len(results['categories']['items'])}개 항목\n")
-                    f.write("-" * 50 + "\n\n")
-                    
-                    for item_id, item_info in results['categories']['items'].items():
-                        f.write(f"ID: {item_id}\n")
-                        if 'name_code' in item_info:
-                            f.write(f"이름 코드: {item_info['name_code']}\n")
-                            f.write(f"이름: {item_info['name']}\n")
-                        if 'desc_code' in item_info:
-                            f.write(f"설명 코드: {item_info['desc_code']}\n")
-                            f.write(f"설명: {item_info['desc']}\n")
-                        for key, value in item_info.items():
-                            if key not in ['id', 'name_code', 'desc_code', 'name', 'desc']:
-                                f.write(f"{key}: {value}\n")
-                        f.write("-" * 30 + "\n")
+                report_path = profiler.write_report(save_dir, {
+                    'errors': results.get('errors'),
+                    'conflicts': results.get('conflicts'),
+                    'string_pool': results.get('string_pool')
+                })
+                self.progress_text.append(f"실행 리포트 저장: {os.path.basename(report_path)}")
             except Exception as e:
-                self.progress_text.append(f"아이템 정보 저장 중 오류: {str(e)}")
+                self.progress_text.append(f"실행 리포트 저장 중 오류: {str(e)}")
             
             self.progress_text.append("\n처리가 완료되었습니다!")
             self.progress_text.append(f"결과가 다음 위치에 저장되었습니다:\n{save_dir}")
-            os.startfile(save_dir)
+            if not self.auto_run:
+                os.startfile(save_dir)
             
         except Exception as e:
             self.progress_text.append(f"결과 저장 중 오류 발생: {str(e)}")
+        
+        # 처리 중 감지된 폴더 변경 반영
+        if self.rerun_pending:
+            self.rerun_pending = False
+            self.scan_source_folder()
+            self.start_processing(auto=True)
 
     def reset_all(self):
         """모든 데이터 초기화"""
+        # 폴더 감시 종료
+        self.watch_check.setChecked(False)
+        self.stop_watch()
+        self.source_folder = None
+        self.record_cache = None
+        self.rerun_pending = False
+        
         # 파일 리스트 초기화
         self.xml_files = []
+        self.file_kinds = {}
+        self.source_root = None
+        self.source_names = {}
         self.string_list.clear()
         self.item_list.clear()
         self.other_list.clear()
@@ -842,20 +2750,47 @@ class ItemExtractorGUI(QMainWindow):
         self.progress_text.append("초기화 완료")
         
         # 검색 결과 초기화
-        self.search_result.clear()
+        if self.search_result is not None:
+            self.search_result.clear()
+        self.loaded_categories = None
+        self.search_indexes = {}
         
         # worker 객체 초기화
         if hasattr(self, 'worker'):
             delattr(self, 'worker')
         
         # 검색 입력 초기화
-        self.search_input.clear()
+        if self.search_input is not None:
+            self.search_input.clear()
+
+def report_startup(app, timings):
+    """시작 시간 측정 결과 출력 후 종료 (--benchmark-startup)"""
+    timings['interactive'] = time.perf_counter()
+    print("=== 시작 시간 측정 ===")
+    print(f"모듈 import: {(timings['main'] - _MODULE_START) * 1000:.1f}ms")
+    print(f"QApplication 생성: {(timings['app'] - timings['main']) * 1000:.1f}ms")
+    print(f"창 생성: {(timings['window'] - timings['app']) * 1000:.1f}ms")
+    print(f"창 표시: {(timings['shown'] - timings['window']) * 1000:.1f}ms")
+    print(f"입력 가능까지 (모듈 import 시작 기준): {(timings['interactive'] - _MODULE_START) * 1000:.1f}ms")
+    app.quit()
+
 
 def main():
+    benchmark = "--benchmark-startup" in sys.argv
+    timings = {'main': time.perf_counter()}
     app = QApplication(sys.argv)
+    timings['app'] = time.perf_counter()
     window = ItemExtractorGUI()
+    timings['window'] = time.perf_counter()
     window.show()
+    timings['shown'] = time.perf_counter()
+    if benchmark:
+        # 이벤트 루프가 처음 돌 때 = 창이 입력을 받을 수 있는 시점
+        QTimer.singleShot(0, lambda: report_startup(app, timings))
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
+    # 복구 스캔 프로세스 풀 (exe 배포 시 필요)
+    import multiprocessing
+    multiprocessing.freeze_support()
     main() 
@@ -0,0 +1,291 @@
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+import item_extractor_gui as extractor
+
+
+def write_xml(tmp_path, name, text, encoding="utf-8"):
+    path = tmp_path / name
+    path.write_bytes(text.encode(encoding))
+    return str(path)
+
+
+def stream_batches(file_path, kind):
+    records = []
+    errors = []
+    for batch_records, batch_errors in extractor.iter_record_batches(file_path, kind):
+        records.extend(batch_records)
+        errors.extend(batch_errors)
+    return records, errors
+
+
+def recovered_batches(file_path, kind, **options):
+    records = []
+    errors = []
+    for batch_records, batch_errors in extractor.iter_recovered_batches(file_path, kind, **options):
+        records.extend(batch_records)
+        errors.extend(batch_errors)
+    return records, errors
+
+
+def test_recovery_scan_keeps_self_closing_records(tmp_path):
+    file_path = write_xml(tmp_path, "quests.xml",
+                          '<?xml version="1.0" encoding="utf-8"?>\n<quests>\n'
+                          '<quest id="1"/>\n'
+                          '<quest id="2"><name>Q2</name></quest>\n'
+                          '<quest id="3" />\n'
+                          '</quests>\n')
+    streamed = stream_batches(file_path, 'quest')
+    recovered = recovered_batches(file_path, 'quest')
+    assert [record['id'] for record in recovered[0]] == ["1", "2", "3"]
+    assert recovered == streamed
+
+
+def test_exclude_pattern_matches_top_level_and_nested_folders(tmp_path):
+    for rel_path in ("a.xml", "backup/a.xml", "sub/backup/b.xml", "backupx/c.xml"):
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("<strings/>")
+    found = extractor.scan_xml_folder(str(tmp_path), exclude=["*/backup/*"])
+    assert sorted(os.path.relpath(path, tmp_path).replace(os.sep, "/") for path in found) == [
+        "a.xml", "backupx/c.xml"]
+
+
+def test_string_with_empty_body_is_valid(tmp_path):
+    file_path = write_xml(tmp_path, "strings.xml",
+                          '<?xml version="1.0" encoding="utf-8"?>\n<strings>\n'
+                          '<string><id>1</id><name>STR_EMPTY</name><body></body></string>\n'
+                          '<string><id>2</id><name>STR_BLANK</name><body/></string>\n'
+                          '<string><id>3</id><name></name><body>x</body></string>\n'
+                          '<string><id>4</id><name>STR_NO_BODY</name></string>\n'
+                          '</strings>\n')
+    records, errors = stream_batches(file_path, 'string')
+    assert records == [("STR_EMPTY", ""), ("STR_BLANK", "")]
+    assert [reason for reason, tag, ordinal in errors] == [
+        "필수 필드 비어 있음: name", "필수 필드 누락: body"]
+
+
+def make_index():
+    records = [
+        {'id': "1", 'name': "Fire Sword", 'desc': "burning blade", 'type': "weapon",
+         'quality': "rare", 'level': "10", 'category': "craft", 'equipment_slots': "main"},
+        {'id': "2", 'name': "Ice Sword", 'desc': "frozen blade", 'type': "weapon",
+         'quality': "common", 'level': "20", 'category': "craft", 'equipment_slots': "main"},
+        {'id': "3", 'name': "Fire Potion", 'desc': "drink", 'type': "potion",
+         'quality': "common", 'level': "10.5", 'category': "misc", 'equipment_slots': "none"},
+        {'id': "4", 'name': "Old Shield", 'desc': "wooden", 'type': "shield",
+         'quality': "legend", 'level': "Unknown", 'category': "event", 'equipment_slots': "sub"},
+    ]
+    return extractor.SearchIndex(records)
+
+
+def search_ids(index, query):
+    total, records = index.search(query)
+    assert total == len(records)
+    return sorted(record['id'] for record in records)
+
+
+def test_parse_query_fields_aliases_and_terms():
+    index = make_index()
+    filters, terms = index.parse_query('타입:weapon,Potion -등급:rare name:"fire s" lv>=10 sword -ice')
+    assert filters == [
+        ('values', 'type', ["weapon", "potion"], False),
+        ('values', 'quality', ["rare"], True),
+        ('contains', 'name', "fire s", False),
+        ('range', 'level', (10.0, None, False), False),
+    ]
+    assert terms == [("sword", False), ("ice", True)]
+
+
+@pytest.mark.parametrize("query, bounds", [
+    ("level:10", (10.0, 10.0, False)),
+    ("level:-5", (-5.0, -5.0, False)),
+    ("level:10..20", (10.0, 20.0, False)),
+    ("level:10-20", (10.0, 20.0, False)),
+    ("level:10~20", (10.0, 20.0, False)),
+    ("level:..20", (None, 20.0, False)),
+    ("level:10..", (10.0, None, False)),
+    ("level:-5..5", (-5.0, 5.0, False)),
+    ("level>10", (10.0, None, True)),
+    ("level<10", (None, 10.0, True)),
+    ("level>=10", (10.0, None, False)),
+    ("level:<=10", (None, 10.0, False)),
+    ("level:>10", (10.0, None, True)),
+])
+def test_parse_range_bounds(query, bounds):
+    filters, terms = make_index().parse_query(query)
+    assert filters == [('range', 'level', bounds, False)]
+    assert terms == []
+
+
+@pytest.mark.parametrize("query", ["level:abc", "level:..", "level>x", "type>3", "color:red"])
+def test_parse_query_rejects_invalid_filters(query):
+    with pytest.raises(ValueError):
+        make_index().parse_query(query)
+
+
+@pytest.mark.parametrize("query, ids", [
+    ("level:10", ["1"]),
+    ("level:10..20", ["1", "2", "3"]),
+    ("level>10", ["2", "3"]),
+    ("level>=10.5", ["2", "3"]),
+    ("level<20", ["1", "3"]),
+    ("level<=20", ["1", "2", "3"]),
+    ("level:20..10", []),
+    ("-level:10..20", ["4"]),
+])
+def test_range_search_edges(query, ids):
+    assert search_ids(make_index(), query) == ids
+
+
+def test_search_combines_filters_terms_and_ranking():
+    index = make_index()
+    assert search_ids(index, "type:weap* sword") == ["1", "2"]
+    assert search_ids(index, "fire -potion") == ["1"]
+    assert search_ids(index, "quality:common,legend -type:shield") == ["2", "3"]
+    assert search_ids(index, "name:sword id:2") == ["2"]
+    total, records = index.search("fire bla")
+    assert total == 1 and records[0]['id'] == "1"
+    total, records = index.search("fire", limit=1)
+    assert total == 2 and len(records) == 1
+
+
+def item_xml(count, declaration="utf-8", corrupt=()):
+    lines = [f'<?xml version="1.0" encoding="{declaration}"?>', "<client_items>"]
+    for index in range(count):
+        name = f"STR_{index}"
+        if index in corrupt:
+            name += "</nam e>"
+        lines.append(f"<client_item><id>{index}</id><name>{name}</name><level>{index % 7}</level>"
+                     "</client_item>")
+    lines.append("</client_items>")
+    return "\n".join(lines) + "\n"
+
+
+@pytest.mark.parametrize("head, expected", [
+    (b"\xef\xbb\xbf<?xml version='1.0'?>", ('utf-8', 3, 1)),
+    ("<a/>".encode('utf-16-le'), ('utf-16-le', 0, 2)),
+    ("<a/>".encode('utf-16-be'), ('utf-16-be', 0, 2)),
+    (b"\xff\xfe" + "<a/>".encode('utf-16-le'), ('utf-16-le', 2, 2)),
+    (b"\xfe\xff" + "<a/>".encode('utf-16-be'), ('utf-16-be', 2, 2)),
+    (b"\xff\xfe\x00\x00" + "<a/>".encode('utf-32-le'), ('utf-32-le', 4, 4)),
+    (b'<?xml version="1.0" encoding="EUC-KR"?><a/>', ('euc_kr', 0, 1)),
+    (b'  <?xml version="1.0" encoding=\'cp949\'?>', ('cp949', 0, 1)),
+    (b'<?xml version="1.0" encoding="utf-16"?><a/>', ('utf-8', 0, 1)),
+    (b'<?xml version="1.0" encoding="no-such-codec"?>', ('utf-8', 0, 1)),
+    (b"<a/>", ('utf-8', 0, 1)),
+])
+def test_sniff_xml_encoding(head, expected):
+    assert extractor.sniff_xml_encoding(head) == expected
+
+
+@pytest.mark.parametrize("encoding, declaration", [
+    ('utf-16', "utf-16"),
+    ('utf-16-be', "utf-16"),
+    ('euc-kr', "euc-kr"),
+    ('utf-8', "utf-8"),
+])
+def test_recovery_scan_matches_stream_parse_across_encodings(tmp_path, encoding, declaration):
+    reference = write_xml(tmp_path, "reference.xml", item_xml(300))
+    file_path = write_xml(tmp_path, "items.xml", item_xml(300, declaration), encoding)
+    records, errors = recovered_batches(file_path, 'item', batch_size=64, chunk_size=1024)
+    assert (records, errors) == stream_batches(reference, 'item')
+    assert extractor.detect_xml_kind(file_path) == 'item'
+
+
+def test_plan_record_chunks_split_at_record_starts(tmp_path):
+    text = item_xml(200)
+    file_path = write_xml(tmp_path, "items.xml", text, 'utf-16')
+    data = open(file_path, 'rb').read()
+    chunks = extractor.plan_record_chunks(file_path, 'item', 'utf-16-le', 2, 1000)
+    assert len(chunks) > 5
+    assert chunks[0][0] == 0 and chunks[-1][1] == len(data)
+    marker = "<client_item>".encode('utf-16-le')
+    for (start, end), (next_start, next_end) in zip(chunks, chunks[1:]):
+        assert end == next_start
+        assert data[next_start:next_start + len(marker)] == marker
+
+
+def test_recovery_scan_reports_corrupt_records_by_ordinal(tmp_path):
+    file_path = write_xml(tmp_path, "items.xml", item_xml(100, corrupt={10, 57}))
+    records, errors = recovered_batches(file_path, 'item', batch_size=16, chunk_size=512)
+    assert len(records) == 98
+    assert [(reason, ordinal) for reason, tag, ordinal in errors] == [
+        ("레코드 XML 파싱 오류", 10), ("레코드 XML 파싱 오류", 57)]
+    skipped, skipped_errors = recovered_batches(file_path, 'item', chunk_size=512, skip=40)
+    assert [record['id'] for record in skipped] == [str(index) for index in range(40, 100) if index != 57]
+    assert [ordinal for reason, tag, ordinal in skipped_errors] == [57]
+    lines = extractor.find_record_lines(file_path, 'client_item', [10, 57])
+    assert lines == {10: 13, 57: 60}
+
+
+def test_auto_mode_resumes_after_parse_error(tmp_path, monkeypatch):
+    monkeypatch.setenv(extractor.DataExtractorWorker.ENV_SCAN_MODE, "auto")
+    monkeypatch.setenv(extractor.DataExtractorWorker.ENV_SCAN_WORKERS, "1")
+    file_path = write_xml(tmp_path, "items.xml", item_xml(2500, corrupt={1500}))
+    worker = extractor.DataExtractorWorker([file_path], "")
+    records = []
+    errors = []
+    for batch_records, batch_errors in worker.iter_parsed_batches(file_path, 'item'):
+        records.extend(batch_records)
+        errors.extend(batch_errors)
+    assert [record['id'] for record in records] == [str(index) for index in range(2500) if index != 1500]
+    assert [(reason, ordinal) for reason, tag, ordinal in errors] == [("레코드 XML 파싱 오류", 1500)]
+
+
+def test_stream_mode_still_stops_at_parse_error(tmp_path, monkeypatch):
+    monkeypatch.setenv(extractor.DataExtractorWorker.ENV_SCAN_MODE, "stream")
+    file_path = write_xml(tmp_path, "items.xml", item_xml(2500, corrupt={1500}))
+    worker = extractor.DataExtractorWorker([file_path], "")
+    read = 0
+    with pytest.raises(extractor.ET.ParseError):
+        for batch_records, batch_errors in worker.iter_parsed_batches(file_path, 'item'):
+            read += len(batch_records)
+    assert read == 1500
+
+
+def test_resolve_streams_batches_and_writes_same_file_overrides_last(tmp_path, monkeypatch):
+    monkeypatch.setattr(extractor.DataExtractorWorker, "BATCH_SIZE", 2)
+    strings = write_xml(tmp_path, "strings.xml",
+                        '<strings><string><id>1</id><name>STR_A</name><body>a</body></string></strings>')
+    items = write_xml(tmp_path, "items.xml",
+                      "<client_items>"
+                      + "".join(f"<client_item><id>{key}</id><name>STR_A</name><level>{level}</level></client_item>"
+                                for key, level in (("1", "1"), ("2", "1"), ("3", "1"), ("1", "2"), ("4", "1")))
+                      + "</client_items>")
+    save_dir = tmp_path / "out"
+    save_dir.mkdir()
+    worker = extractor.DataExtractorWorker([strings, items], "", save_dir=str(save_dir))
+    worker.run()
+    text = (save_dir / "items_info.txt").read_text(encoding="utf-8")
+    assert "총 4개 항목" in text
+    body, override = text.split("=== 재정의: items.xml (1개")
+    assert [line for line in body.splitlines() if line.startswith("ID: ")] == [
+        "ID: 1", "ID: 2", "ID: 3", "ID: 4"]
+    assert "ID: 1" in override and "level: 2" in override
+
+
+def test_recovery_scan_is_serial_unless_workers_set(tmp_path, monkeypatch):
+    monkeypatch.delenv(extractor.DataExtractorWorker.ENV_SCAN_WORKERS, raising=False)
+    worker = extractor.DataExtractorWorker([], "")
+    assert worker.scan_workers == 1 and worker.scan_executor() is None
+    monkeypatch.setenv(extractor.DataExtractorWorker.ENV_SCAN_WORKERS, "3")
+    assert extractor.DataExtractorWorker([], "").scan_workers == 3
+
+
+def test_merge_priority_matches_paths_relative_to_source_root(tmp_path):
+    paths = []
+    for locale in ("en", "ko"):
+        (tmp_path / locale).mkdir()
+        paths.append(write_xml(tmp_path / locale, "client_strings.xml",
+                               f"<strings><string><id>1</id><name>STR_A</name><body>{locale}</body></string>"
+                               "</strings>"))
+    items = write_xml(tmp_path, "items.xml", item_xml(1))
+    policy = extractor.MergePolicy(extractor.MergePolicy.PRIORITY, ["en/*", "ko/*"])
+    worker = extractor.DataExtractorWorker(paths + [items], "", merge_policy=policy, source_root=str(tmp_path))
+    assert policy.pattern_priority(paths[0]) == 2 and policy.pattern_priority(paths[1]) == 1
+    worker.run()
+    assert worker.strings["STR_A"] == "en"